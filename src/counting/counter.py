@@ -48,8 +48,17 @@ class CardCounter:
         Args:
             cards: List of cards that were dealt
         """
+        if not cards:
+            return
+        
+        card_counts = self._card_counts
         for card in cards:
-            self.update_count(card)
+            card_counts[card.rank] -= 1
+        self.running_count += sum(card.count_value for card in cards)
+        self._total_cards_seen += len(cards)
+        
+        # Update true count once for the whole batch
+        self._update_true_count()
     
     def _update_true_count(self) -> None:
         """Update the true count based on current running count and decks remaining."""
@@ -1,5 +1,6 @@
 from typing import List, Optional, Tuple, Dict
 from enum import Enum
+from functools import lru_cache
 from .card import Card
 from .hand import Hand
 from .deck import Deck
@@ -27,6 +28,41 @@ class GameResult(Enum):
     PLAYER_SURRENDER = "player_surrender"
 
 
+@lru_cache(maxsize=None)
+def _resolve_hand(hand_total: int, hand_bust: bool, hand_blackjack: bool, hand_surrendered: bool,
+                  dealer_total: int, dealer_bust: bool, dealer_blackjack: bool,
+                  blackjack_pays_3_to_2: bool) -> Tuple[GameResult, float]:
+    """
+    Resolve one player hand against the dealer.
+    
+    Only totals and flags go in, so the handful of distinct outcomes are cached.
+    
+    Returns:
+        Tuple of (result, payout as a multiple of the hand's bet)
+    """
+    if hand_surrendered:
+        return GameResult.PLAYER_SURRENDER, 0.5
+    
+    if hand_bust:
+        return GameResult.DEALER_WIN, 0.0
+    
+    if hand_blackjack:
+        if dealer_blackjack:
+            return GameResult.PUSH, 1.0
+        # Already includes bet + winnings
+        return GameResult.PLAYER_BLACKJACK, (2.5 if blackjack_pays_3_to_2 else 2.0)
+    
+    if dealer_blackjack:
+        return GameResult.DEALER_BLACKJACK, 0.0
+    
+    # 2x for win (bet + winnings)
+    if dealer_bust or hand_total > dealer_total:
+        return GameResult.PLAYER_WIN, 2.0
+    if hand_total < dealer_total:
+        return GameResult.DEALER_WIN, 0.0
+    return GameResult.PUSH, 1.0
+
+
 class BlackjackGame:
     """Main blackjack game engine."""
     
@@ -43,16 +79,16 @@ class BlackjackGame:
         self.min_bet = min_bet
         self.max_bet = max_bet
         
-        # Game state
+        # Game state (money is kept in integer cents)
         self.state = GameState.BETTING
-        self.current_bet = 0.0
-        self.insurance_bet = 0.0
+        self.current_bet_cents = 0
+        self.insurance_bet_cents = 0
         self.player_hands: List[Hand] = []
         self.dealer_hand = Hand()
         self.current_hand_index = 0
         
         # Game statistics
-        self.player_bankroll = 1000.0
+        self.player_bankroll_cents = 100000
         self.games_played = 0
         self.games_won = 0
         self.games_lost = 0
@@ -71,6 +107,33 @@ class BlackjackGame:
         # Strategy calculator
         self.strategy_calculator = StrategyCalculator(self.card_counter)
     
+    @property
+    def current_bet(self) -> float:
+        """Get the current bet in dollars."""
+        return self.current_bet_cents / 100
+    
+    @current_bet.setter
+    def current_bet(self, amount: float) -> None:
+        self.current_bet_cents = round(amount * 100)
+    
+    @property
+    def insurance_bet(self) -> float:
+        """Get the insurance bet in dollars."""
+        return self.insurance_bet_cents / 100
+    
+    @insurance_bet.setter
+    def insurance_bet(self, amount: float) -> None:
+        self.insurance_bet_cents = round(amount * 100)
+    
+    @property
+    def player_bankroll(self) -> float:
+        """Get the player's bankroll in dollars."""
+        return self.player_bankroll_cents / 100
+    
+    @player_bankroll.setter
+    def player_bankroll(self, amount: float) -> None:
+        self.player_bankroll_cents = round(amount * 100)
+    
     def place_bet(self, amount: float) -> bool:
         """
         Place a bet for the current hand.
@@ -91,7 +154,7 @@ class BlackjackGame:
             return False
         
         self.current_bet = amount
-        self.player_bankroll -= amount
+        self.player_bankroll_cents -= self.current_bet_cents
         self.state = GameState.DEALING
         return True
     
@@ -225,12 +288,12 @@ class BlackjackGame:
         if not current_hand.can_double:
             return False
         
-        if self.current_bet > self.player_bankroll:
+        if self.current_bet_cents > self.player_bankroll_cents:
             return False
         
         # Double the bet
-        self.player_bankroll -= self.current_bet
-        self.current_bet *= 2
+        self.player_bankroll_cents -= self.current_bet_cents
+        self.current_bet_cents *= 2
         
         # Deal one more card
         card = self.deck.deal_card()
@@ -263,7 +326,7 @@ class BlackjackGame:
         if not current_hand.can_split:
             return False
         
-        if self.current_bet > self.player_bankroll:
+        if self.current_bet_cents > self.player_bankroll_cents:
             return False
         
         # Create new hand
@@ -272,7 +335,7 @@ class BlackjackGame:
         self.player_hands.insert(self.current_hand_index + 1, new_hand)
         
         # Deduct bet for new hand
-        self.player_bankroll -= self.current_bet
+        self.player_bankroll_cents -= self.current_bet_cents
         
         # Deal cards to both hands
         for i in range(2):
@@ -298,14 +361,15 @@ class BlackjackGame:
         if self.state != GameState.INSURANCE:
             return False
         
-        if amount > self.player_bankroll:
+        amount_cents = round(amount * 100)
+        if amount_cents > self.player_bankroll_cents:
             return False
         
-        if amount > self.current_bet / 2:
+        if amount_cents * 2 > self.current_bet_cents:
             return False  # Insurance is typically limited to half the original bet
         
-        self.insurance_bet = amount
-        self.player_bankroll -= amount
+        self.insurance_bet_cents = amount_cents
+        self.player_bankroll_cents -= amount_cents
         
         # After placing insurance, proceed with the game
         # Check for dealer blackjack
@@ -383,8 +447,15 @@ class BlackjackGame:
         
         return True
     
-    def play_dealer_hand(self) -> None:
-        """Play out the dealer's hand according to house rules."""
+    def play_dealer_hand(self, finish: bool = True) -> None:
+        """
+        Play out the dealer's hand according to house rules.
+        
+        Args:
+            finish: Whether to end the dealer's turn once the hand is played; pass False
+                to stay in DEALER_TURN (e.g. while the drawn cards are revealed) and
+                call finish_dealer_turn() afterwards
+        """
         if self.state != GameState.DEALER_TURN:
             return
         
@@ -393,7 +464,8 @@ class BlackjackGame:
         
         # If all hands are busted or surrendered, dealer doesn't need to play
         if not active_hands:
-            self.state = GameState.GAME_OVER
+            if finish:
+                self.finish_dealer_turn()
             return
         
         # Dealer plays according to house rules
@@ -404,7 +476,13 @@ class BlackjackGame:
             self.dealer_hand.add_card(card)
             self.card_counter.update_count(card)
         
-        self.state = GameState.GAME_OVER
+        if finish:
+            self.finish_dealer_turn()
+    
+    def finish_dealer_turn(self) -> None:
+        """End the dealer's turn so the results can be determined."""
+        if self.state == GameState.DEALER_TURN:
+            self.state = GameState.GAME_OVER
     
     def determine_results(self) -> List[Tuple[Hand, GameResult, float]]:
         """
@@ -419,56 +497,37 @@ class BlackjackGame:
         results = []
         base_bet = self.current_bet / len(self.player_hands)
         
+        dealer_total = self.dealer_hand.total
+        dealer_bust = dealer_total > 21
+        dealer_blackjack = self.dealer_hand.is_blackjack
+        
         for hand in self.player_hands:
-            if hand.is_surrendered:
-                results.append((hand, GameResult.PLAYER_SURRENDER, base_bet * 0.5))
-                continue
-            
-            if hand.is_bust:
-                results.append((hand, GameResult.DEALER_WIN, 0.0))
-                continue
-            
-            if hand.is_blackjack:
-                if self.dealer_hand.is_blackjack:
-                    results.append((hand, GameResult.PUSH, base_bet))
-                else:
-                    payout = base_bet * (2.5 if self.blackjack_pays_3_to_2 else 2.0)  # Already includes bet + winnings
-                    results.append((hand, GameResult.PLAYER_BLACKJACK, payout))
-                continue
-            
-            if self.dealer_hand.is_blackjack:
-                results.append((hand, GameResult.DEALER_BLACKJACK, 0.0))
-                continue
-            
-            if self.dealer_hand.is_bust:
-                payout = base_bet * (2.0 if hand.is_doubled else 2.0)  # 2x for win (bet + winnings)
-                results.append((hand, GameResult.PLAYER_WIN, payout))
-                continue
-            
-            if hand.total > self.dealer_hand.total:
-                payout = base_bet * (2.0 if hand.is_doubled else 2.0)  # 2x for win (bet + winnings)
-                results.append((hand, GameResult.PLAYER_WIN, payout))
-            elif hand.total < self.dealer_hand.total:
-                results.append((hand, GameResult.DEALER_WIN, 0.0))
-            else:
-                results.append((hand, GameResult.PUSH, base_bet))
+            hand_total = hand.total
+            result, multiplier = _resolve_hand(
+                hand_total, hand_total > 21, hand.is_blackjack, hand.is_surrendered,
+                dealer_total, dealer_bust, dealer_blackjack, self.blackjack_pays_3_to_2
+            )
+            results.append((hand, result, base_bet * multiplier))
         
         return results
     
     def update_statistics(self, results: List[Tuple[Hand, GameResult, float]]) -> None:
         """Update game statistics based on results."""
-        total_payout = 0.0
+        total_payout_cents = 0
         
         # Handle insurance payout
-        if self.insurance_bet > 0:
+        if self.insurance_bet_cents > 0:
             if self.dealer_hand.is_blackjack:
                 # Insurance pays 2:1
-                insurance_payout = self.insurance_bet * 3  # bet + 2x winnings
-                total_payout += insurance_payout
+                insurance_payout_cents = self.insurance_bet_cents * 3  # bet + 2x winnings
+                total_payout_cents += insurance_payout_cents
             # If dealer doesn't have blackjack, insurance bet is lost (no payout)
         
+        # Hand payouts are in dollars and may include half a dollar from a 3:2 blackjack
+        hand_payout = 0.0
+        
         for hand, result, payout in results:
-            total_payout += payout
+            hand_payout += payout
             
             if result in [GameResult.PLAYER_WIN, GameResult.PLAYER_BLACKJACK]:
                 self.games_won += 1
@@ -477,15 +536,16 @@ class BlackjackGame:
             elif result == GameResult.PUSH:
                 self.games_pushed += 1
         
-        self.player_bankroll += total_payout
+        total_payout_cents += round(hand_payout * 100)
+        self.player_bankroll_cents += total_payout_cents
         self.games_played += 1
-        self.insurance_bet = 0.0  # Reset insurance bet
+        self.insurance_bet_cents = 0  # Reset insurance bet
     
     def start_new_hand(self) -> None:
         """Start a new hand, resetting game state."""
         self.state = GameState.BETTING
-        self.current_bet = 0.0
-        self.insurance_bet = 0.0
+        self.current_bet_cents = 0
+        self.insurance_bet_cents = 0
         self.player_hands.clear()
         self.dealer_hand.clear()
         self.current_hand_index = 0
@@ -2,18 +2,21 @@
 GUI components for the Blackjack game.
 """
 
-from .card_display import CardDisplay
+from .card_display import CardDisplay, load_card_images
 from .count_display import CountDisplay
 from .strategy_display import StrategyDisplay
 from .betting_panel import BettingPanel
 from .action_panel import ActionPanel
 from .game_status import GameStatus
+from .scheduler import DisplayScheduler
 
 __all__ = [
     'CardDisplay',
+    'load_card_images',
     'CountDisplay', 
     'StrategyDisplay',
     'BettingPanel',
     'ActionPanel',
-    'GameStatus'
+    'GameStatus',
+    'DisplayScheduler'
 ] 
\ No newline at end of file
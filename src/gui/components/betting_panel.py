@@ -5,12 +5,13 @@ Betting panel component for placing bets and managing bankroll.
 import tkinter as tk
 from tkinter import ttk
 from typing import Callable, Optional
+from ...utils.utils import format_cents
 
 
 class BettingPanel(ttk.LabelFrame):
     """Component for betting interface."""
     
-    def __init__(self, parent, min_bet: int, max_bet: int, initial_bankroll: int = 1000):
+    def __init__(self, parent, min_bet: int, max_bet: int, initial_bankroll_cents: int = 100000):
         """
         Initialize the betting panel.
         
@@ -18,12 +19,13 @@ class BettingPanel(ttk.LabelFrame):
             parent: Parent widget
             min_bet: Minimum bet amount
             max_bet: Maximum bet amount
-            initial_bankroll: Initial bankroll amount
+            initial_bankroll_cents: Initial bankroll in cents
         """
         super().__init__(parent, text="Betting", padding=(10, 20))
         self.min_bet = min_bet
         self.max_bet = max_bet
-        self.current_bankroll = initial_bankroll
+        self.current_bankroll_cents = initial_bankroll_cents
+        self._last_bankroll_cents = None
         self.on_bet_placed: Optional[Callable[[int], None]] = None
         
         self._create_widgets()
@@ -35,7 +37,8 @@ class BettingPanel(ttk.LabelFrame):
         self.bankroll_frame.pack(fill=tk.X, pady=(0, 20))
         
         ttk.Label(self.bankroll_frame, text="Bankroll:", font=('Arial', 14, 'bold'),).pack(anchor=tk.W)
-        self.bankroll_label = ttk.Label(self.bankroll_frame, text=f"${format(self.current_bankroll, ',')}", font=('Arial', 14, 'bold'), foreground='#ffffff')   
+        self.bankroll_var = tk.StringVar(value="$" + format_cents(self.current_bankroll_cents))
+        self.bankroll_label = ttk.Label(self.bankroll_frame, textvariable=self.bankroll_var, font=('Arial', 14, 'bold'), foreground='#ffffff')
         self.bankroll_label.pack(anchor=tk.W)
         
         # Bet amount entry
@@ -141,7 +144,7 @@ class BettingPanel(ttk.LabelFrame):
             current_bet = int(self.bet_var.get())
             new_bet = current_bet + amount
             # Check if new bet exceeds bankroll
-            if new_bet <= self.current_bankroll:
+            if new_bet * 100 <= self.current_bankroll_cents:
                 self.bet_var.set(str(new_bet))
             else:
                 # Could add a warning message here
@@ -213,20 +216,25 @@ class BettingPanel(ttk.LabelFrame):
             # Invalid bet amount
             pass
     
-    def update_bankroll(self, bankroll: int):
+    def update_bankroll(self, bankroll_cents: int):
         """
         Update the bankroll display.
         
         Args:
-            bankroll: Current bankroll amount
+            bankroll_cents: Current bankroll in cents
         """
-        self.current_bankroll = bankroll
-        self.bankroll_label.config(text=f"${format(bankroll, ',')}")
+        # Skip the widget updates when the bankroll has not changed
+        if bankroll_cents == self._last_bankroll_cents:
+            return
+        self._last_bankroll_cents = bankroll_cents
+        
+        self.current_bankroll_cents = bankroll_cents
+        self.bankroll_var.set("$" + format_cents(bankroll_cents))
         
         # Color code bankroll
-        if bankroll > 1000:
+        if bankroll_cents > 100000:
             self.bankroll_label.config(foreground='#03C40A')
-        elif bankroll < 500:
+        elif bankroll_cents < 50000:
             self.bankroll_label.config(foreground='#FF6B6B')
         else:
             self.bankroll_label.config(foreground='#FFFFFF')
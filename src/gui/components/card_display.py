@@ -4,33 +4,110 @@ Card display component for showing hands of cards.
 
 import tkinter as tk
 from tkinter import ttk
-from typing import List, Optional
+from typing import Dict, List, Optional
 from ...game.card import Card, Suit, Rank
 from ...game.hand import Hand
 import os
 from PIL import Image, ImageTk
 
+# Key of the card back image in the dictionary returned by load_card_images
+CARD_BACK = "back"
+
+
+def load_card_images() -> Dict:
+    """
+    Load the card back and face card images from assets.
+    
+    Returns:
+        Dictionary of images keyed by (rank, suit) for face cards and CARD_BACK for the card back
+    """
+    images = {}
+    card_back_image = _load_card_back_image()
+    if card_back_image:
+        images[CARD_BACK] = card_back_image
+    images.update(_load_face_card_images())
+    return images
+
+
+def _load_card_back_image() -> Optional[ImageTk.PhotoImage]:
+    """Load the card back image from assets."""
+    try:
+        # Get the path to the assets directory
+        current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        assets_dir = os.path.join(current_dir, 'assets')
+        image_path = os.path.join(assets_dir, 'card_back.png')
+        
+        # Load and resize the image to fit the card dimensions
+        original_image = Image.open(image_path)
+        resized_image = original_image.resize((116, 156), Image.Resampling.LANCZOS)  # Slightly smaller than card frame
+        return ImageTk.PhotoImage(resized_image)
+    except Exception as e:
+        print(f"Failed to load card back image: {e}")
+        return None
+
+
+def _load_face_card_images() -> Dict:
+    """Load all face card images from assets."""
+    face_card_images = {}
+    try:
+        # Get the path to the assets directory
+        current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        assets_dir = os.path.join(current_dir, 'assets', 'face_cards')
+        
+        # Define face card ranks and suits
+        face_ranks = ['jack', 'queen', 'king']
+        suits = ['clubs', 'diamonds', 'hearts', 'spades']
+        
+        # Load each face card image
+        for rank in face_ranks:
+            for suit in suits:
+                image_path = os.path.join(assets_dir, f'{rank}_of_{suit}.png')
+                
+                # Load and resize the image to fit the card dimensions
+                original_image = Image.open(image_path)
+                
+                # Scale the cropped content to fit the white background frame (118x158)
+                resized_image = original_image.resize((102, 148), Image.Resampling.LANCZOS)
+                
+                # Convert rank and suit names to enum values for lookup
+                rank_enum = getattr(Rank, rank.upper())
+                suit_enum = getattr(Suit, suit.upper())
+                
+                # Store the image with (rank, suit) tuple as key
+                face_card_images[(rank_enum, suit_enum)] = ImageTk.PhotoImage(resized_image)
+                
+    except Exception as e:
+        print(f"Failed to load face card images: {e}")
+        return {}
+    return face_card_images
+
+
 class CardDisplay(ttk.Frame):
     """Component for displaying cards in a hand."""
     
-    def __init__(self, parent, title: str):
+    def __init__(self, parent, title: str, images: Optional[Dict] = None):
         """
         Initialize the card display.
         
         Args:
             parent: Parent widget
             title: Title for this display (e.g., "Dealer", "Player")
+            images: Optional card images from load_card_images, shared between displays
         """
         super().__init__(parent)
         self.title = title
         self.cards: List[Card] = []
         self.hide_first = False
-        self.card_back_image = None
-        self.face_card_images = {}  # Dictionary to store face card images
+        
+        # Card images, keyed by (rank, suit) for face cards and CARD_BACK for the card back
+        if images is None:
+            images = load_card_images()
+        self.card_back_image = images.get(CARD_BACK)
+        self.face_card_images = images
+        self._hand_signature = None  # Signature of the last rendered hand
+        self._card_widgets = []  # Widgets currently packed into cards_frame
         
         self._create_widgets()
-        self._load_card_back_image()
-        self._load_face_card_images()
     
     def _create_widgets(self):
         """Create the widget layout."""
@@ -59,55 +136,6 @@ class CardDisplay(ttk.Frame):
         self.status_label = ttk.Label(self, text="", font=('Arial', 12))
         self.status_label.pack()
     
-    def _load_card_back_image(self):
-        """Load the card back image from assets."""
-        try:
-            # Get the path to the assets directory
-            current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            assets_dir = os.path.join(current_dir, 'assets')
-            image_path = os.path.join(assets_dir, 'card_back.png')
-            
-            # Load and resize the image to fit the card dimensions
-            original_image = Image.open(image_path)
-            resized_image = original_image.resize((116, 156), Image.Resampling.LANCZOS)  # Slightly smaller than card frame
-            self.card_back_image = ImageTk.PhotoImage(resized_image)
-        except Exception as e:
-            print(f"Failed to load card back image: {e}")
-            self.card_back_image = None
-    
-    def _load_face_card_images(self):
-        """Load all face card images from assets."""
-        try:
-            # Get the path to the assets directory
-            current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            assets_dir = os.path.join(current_dir, 'assets', 'face_cards')
-            
-            # Define face card ranks and suits
-            face_ranks = ['jack', 'queen', 'king']
-            suits = ['clubs', 'diamonds', 'hearts', 'spades']
-            
-            # Load each face card image
-            for rank in face_ranks:
-                for suit in suits:
-                    image_path = os.path.join(assets_dir, f'{rank}_of_{suit}.png')
-                    
-                    # Load and resize the image to fit the card dimensions
-                    original_image = Image.open(image_path)
-                    
-                    # Scale the cropped content to fit the white background frame (118x158)
-                    resized_image = original_image.resize((102, 148), Image.Resampling.LANCZOS)
-                    
-                    # Convert rank and suit names to enum values for lookup
-                    rank_enum = getattr(Rank, rank.upper())
-                    suit_enum = getattr(Suit, suit.upper())
-                    
-                    # Store the image with (rank, suit) tuple as key
-                    self.face_card_images[(rank_enum, suit_enum)] = ImageTk.PhotoImage(resized_image)
-                    
-        except Exception as e:
-            print(f"Failed to load face card images: {e}")
-            self.face_card_images = {}
-    
     def update_hand(self, hand: Hand, hide_first: bool = False):
         """
         Update the display with a single hand.
@@ -116,6 +144,12 @@ class CardDisplay(ttk.Frame):
             hand: The hand to display
             hide_first: Whether to hide the first card
         """
+        # Skip the redraw when the hand looks the same as last time
+        signature = (tuple((card.rank, card.suit) for card in hand.cards), hide_first)
+        if signature == self._hand_signature:
+            return
+        self._hand_signature = signature
+        
         self.cards = hand.cards.copy()
         self.hide_first = hide_first
         self._update_display()
@@ -128,6 +162,15 @@ class CardDisplay(ttk.Frame):
             hands: List of hands to display
             current_index: Index of the current hand being played
         """
+        # Skip the redraw when the displayed hand and position are unchanged
+        if hands:
+            signature = (tuple((card.rank, card.suit) for card in hands[current_index].cards), current_index, len(hands))
+        else:
+            signature = ()
+        if signature == self._hand_signature:
+            return
+        self._hand_signature = signature
+        
         if not hands:
             self.cards = []
             self._update_display()
@@ -149,13 +192,15 @@ class CardDisplay(ttk.Frame):
     def _update_display(self):
         """Update the card display."""
         # Clear existing cards
-        for widget in self.cards_frame.winfo_children():
+        for widget in self._card_widgets:
             widget.destroy()
+        self._card_widgets.clear()
         
         if not self.cards:
             # Show empty state
             empty_label = ttk.Label(self.cards_frame, text="No cards", font=('Arial', 12))
             empty_label.pack(expand=True)
+            self._card_widgets.append(empty_label)
             self.total_label.config(text="Total: 0")
             self.status_label.config(text="")
             return
@@ -173,6 +218,7 @@ class CardDisplay(ttk.Frame):
                 card_widget.pack(side=tk.LEFT, padx=(5, 0))
             else:
                 card_widget.pack(side=tk.LEFT, padx=(0, 0))  # Minimal spacing for overlap effect
+            self._card_widgets.append(card_widget)
         
         # Update total and status
         if self.hide_first:
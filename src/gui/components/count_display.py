@@ -6,22 +6,28 @@ import tkinter as tk
 from tkinter import ttk
 from typing import Optional
 from ...counting.counter import CardCounter
+from .scheduler import DisplayScheduler, set_options
+from .styles import install_styles, POSITIVE, NEGATIVE, NEUTRAL
 
 
 class CountDisplay(ttk.LabelFrame):
     """Component for displaying card counting information."""
     
-    def __init__(self, parent, card_counter: CardCounter):
+    def __init__(self, parent, card_counter: CardCounter, scheduler: Optional[DisplayScheduler] = None):
         """
         Initialize the count display.
         
         Args:
             parent: Parent widget
             card_counter: The card counter to display
+            scheduler: Optional display scheduler used to batch widget updates
         """
         super().__init__(parent, text="Card Count", padding=(10, 20))
         self.card_counter = card_counter
+        self.scheduler = scheduler
+        self._count_signature = None  # Signature of the last rendered count
         
+        install_styles(self)
         self._create_widgets()
     
     def _create_widgets(self):
@@ -31,7 +37,8 @@ class CountDisplay(ttk.LabelFrame):
         self.running_frame.pack(fill=tk.X, pady=(0, 20))
         
         ttk.Label(self.running_frame, text="Running Count:", font=('Arial', 12, 'bold')).pack(anchor=tk.W)
-        self.running_label = ttk.Label(self.running_frame, text="0", font=('Arial', 16, 'bold'))
+        self.running_var = tk.StringVar(value="0")
+        self.running_label = ttk.Label(self.running_frame, textvariable=self.running_var, font=('Arial', 16, 'bold'))
         self.running_label.pack(anchor=tk.W)
         
         # True count
@@ -39,7 +46,8 @@ class CountDisplay(ttk.LabelFrame):
         self.true_frame.pack(fill=tk.X, pady=(0, 20))
         
         ttk.Label(self.true_frame, text="True Count:", font=('Arial', 12, 'bold')).pack(anchor=tk.W)
-        self.true_label = ttk.Label(self.true_frame, text="0.00", font=('Arial', 16, 'bold'))
+        self.true_var = tk.StringVar(value="0.00")
+        self.true_label = ttk.Label(self.true_frame, textvariable=self.true_var, font=('Arial', 16, 'bold'))
         self.true_label.pack(anchor=tk.W)
         
         # Count status
@@ -47,7 +55,8 @@ class CountDisplay(ttk.LabelFrame):
         self.status_frame.pack(fill=tk.X, pady=(0, 20))
         
         ttk.Label(self.status_frame, text="Status:", font=('Arial', 12, 'bold')).pack(anchor=tk.W)
-        self.status_label = ttk.Label(self.status_frame, text="Neutral", font=('Arial', 14))
+        self.status_var = tk.StringVar(value="Neutral")
+        self.status_label = ttk.Label(self.status_frame, textvariable=self.status_var, font=('Arial', 14))
         self.status_label.pack(anchor=tk.W)
         
         # Decks remaining
@@ -55,7 +64,8 @@ class CountDisplay(ttk.LabelFrame):
         self.decks_frame.pack(fill=tk.X, pady=(0, 20))
         
         ttk.Label(self.decks_frame, text="Decks Remaining:", font=('Arial', 12, 'bold')).pack(anchor=tk.W)
-        self.decks_label = ttk.Label(self.decks_frame, text="6.00", font=('Arial', 14))
+        self.decks_var = tk.StringVar(value="6.00")
+        self.decks_label = ttk.Label(self.decks_frame, textvariable=self.decks_var, font=('Arial', 14))
         self.decks_label.pack(anchor=tk.W)
         
         # Penetration
@@ -63,7 +73,8 @@ class CountDisplay(ttk.LabelFrame):
         self.penetration_frame.pack(fill=tk.X, pady=(0, 20))
         
         ttk.Label(self.penetration_frame, text="Penetration:", font=('Arial', 12, 'bold')).pack(anchor=tk.W)
-        self.penetration_label = ttk.Label(self.penetration_frame, text="0.0%", font=('Arial', 14))
+        self.penetration_var = tk.StringVar(value="0.0%")
+        self.penetration_label = ttk.Label(self.penetration_frame, textvariable=self.penetration_var, font=('Arial', 14))
         self.penetration_label.pack(anchor=tk.W)
         
         # Betting multiplier
@@ -71,7 +82,8 @@ class CountDisplay(ttk.LabelFrame):
         self.betting_frame.pack(fill=tk.X, pady=(0, 20))
         
         ttk.Label(self.betting_frame, text="Bet Multiplier:", font=('Arial', 12, 'bold')).pack(anchor=tk.W)
-        self.betting_label = ttk.Label(self.betting_frame, text="1.0x", font=('Arial', 14))
+        self.betting_var = tk.StringVar(value="1.0x")
+        self.betting_label = ttk.Label(self.betting_frame, textvariable=self.betting_var, font=('Arial', 14))
         self.betting_label.pack(anchor=tk.W)
     
     def update_count(self, card_counter: CardCounter):
@@ -83,56 +95,63 @@ class CountDisplay(ttk.LabelFrame):
         """
         self.card_counter = card_counter
         
+        # Skip the update when none of the displayed values changed since last time
+        signature = (card_counter.running_count, card_counter.true_count,
+                     card_counter.decks_remaining, card_counter.penetration)
+        if signature == self._count_signature:
+            return
+        self._count_signature = signature
+        
         # Update running count
         running_count = card_counter.running_count
-        self.running_label.config(text=str(running_count))
+        self.running_var.set(str(running_count))
         
         # Color code running count
         if running_count > 0:
-            self.running_label.config(foreground='#03C40A')
+            set_options(self.scheduler, self.running_label, style=POSITIVE)
         elif running_count < 0:
-            self.running_label.config(foreground='#FF6B6B')
+            set_options(self.scheduler, self.running_label, style=NEGATIVE)
         else:
-            self.running_label.config(foreground='#000000')
+            set_options(self.scheduler, self.running_label, style=NEUTRAL)
         
         # Update true count
         true_count = card_counter.true_count
-        self.true_label.config(text=f"{true_count:.2f}")
+        self.true_var.set(f"{true_count:.2f}")
         
         # Color code true count
         if true_count > 0:
-            self.true_label.config(foreground='#03C40A')
+            set_options(self.scheduler, self.true_label, style=POSITIVE)
         elif true_count < 0:
-            self.true_label.config(foreground='#FF6B6B')
+            set_options(self.scheduler, self.true_label, style=NEGATIVE)
         else:
-            self.true_label.config(foreground='#000000')
+            set_options(self.scheduler, self.true_label, style=NEUTRAL)
         
         # Update status
         status = card_counter.get_count_status()
-        self.status_label.config(text=status)
+        self.status_var.set(status)
         
         # Color code status
         if "Favorable" in status:
-            self.status_label.config(foreground='#03C40A')
+            set_options(self.scheduler, self.status_label, style=POSITIVE)
         elif "Unfavorable" in status:
-            self.status_label.config(foreground='#FF6B6B')
+            set_options(self.scheduler, self.status_label, style=NEGATIVE)
         else:
-            self.status_label.config(foreground='#000000')
+            set_options(self.scheduler, self.status_label, style=NEUTRAL)
         
         # Update decks remaining
         decks_remaining = card_counter.decks_remaining
-        self.decks_label.config(text=f"{decks_remaining:.2f}")
+        self.decks_var.set(f"{decks_remaining:.2f}")
         
         # Update penetration
         penetration = card_counter.penetration * 100
-        self.penetration_label.config(text=f"{penetration:.1f}%")
+        self.penetration_var.set(f"{penetration:.1f}%")
         
         # Update betting multiplier
         multiplier = card_counter.get_betting_multiplier()
-        self.betting_label.config(text=f"{multiplier:.1f}x")
+        self.betting_var.set(f"{multiplier:.1f}x")
         
         # Color code betting multiplier
         if multiplier > 1.0:
-            self.betting_label.config(foreground='#03C40A')
+            set_options(self.scheduler, self.betting_label, style=POSITIVE)
         else:
-            self.betting_label.config(foreground='#000000') 
\ No newline at end of file
+            set_options(self.scheduler, self.betting_label, style=NEUTRAL) 
\ No newline at end of file
@@ -4,20 +4,37 @@ Game status component for displaying current game information.
 
 import tkinter as tk
 from tkinter import ttk
+from typing import Optional
 from ...game.game import BlackjackGame, GameState
+from ...utils.utils import format_cents, format_percent
+from .scheduler import DisplayScheduler, set_options
+from .styles import install_styles, POSITIVE, NEGATIVE, NEUTRAL, WARNING, INFO
+
+# Precomputed per-state display text and label styles
+_STATE_TEXT = {state: state.value.replace('_', ' ').title() for state in GameState}
+_STATE_STYLE = {
+    GameState.BETTING: INFO,
+    GameState.PLAYER_TURN: POSITIVE,
+    GameState.DEALER_TURN: WARNING,
+    GameState.GAME_OVER: NEGATIVE,
+}
 
 
 class GameStatus(ttk.Frame):
     """Component for displaying game status information."""
     
-    def __init__(self, parent):
+    def __init__(self, parent, scheduler: Optional[DisplayScheduler] = None):
         """
         Initialize the game status component.
         
         Args:
             parent: Parent widget
+            scheduler: Optional display scheduler used to batch widget updates
         """
         super().__init__(parent)
+        self.scheduler = scheduler
+        self._status_signature = None  # Signature of the last rendered status
+        install_styles(self)
         self._create_widgets()
     
     def _create_widgets(self):
@@ -31,7 +48,8 @@ class GameStatus(ttk.Frame):
         self.state_frame.pack(fill=tk.X, pady=(0, 5))
         
         ttk.Label(self.state_frame, text="State:", font=('Arial', 12, 'bold')).pack(side=tk.LEFT)
-        self.state_label = ttk.Label(self.state_frame, text="Betting", font=('Arial', 12))
+        self.state_var = tk.StringVar(value="Betting")
+        self.state_label = ttk.Label(self.state_frame, textvariable=self.state_var, font=('Arial', 12))
         self.state_label.pack(side=tk.LEFT, padx=(5, 0))
         
         # Current bet
@@ -39,7 +57,8 @@ class GameStatus(ttk.Frame):
         self.bet_frame.pack(fill=tk.X, pady=(0, 5))
         
         ttk.Label(self.bet_frame, text="Current Bet:", font=('Arial', 12, 'bold')).pack(side=tk.LEFT)
-        self.bet_label = ttk.Label(self.bet_frame, text="$0.00", font=('Arial', 12))
+        self.bet_var = tk.StringVar(value="$0.00")
+        self.bet_label = ttk.Label(self.bet_frame, textvariable=self.bet_var, font=('Arial', 12))
         self.bet_label.pack(side=tk.LEFT, padx=(5, 0))
         
         # Games played
@@ -47,7 +66,8 @@ class GameStatus(ttk.Frame):
         self.games_frame.pack(fill=tk.X, pady=(0, 5))
         
         ttk.Label(self.games_frame, text="Games Played:", font=('Arial', 12, 'bold')).pack(side=tk.LEFT)
-        self.games_label = ttk.Label(self.games_frame, text="0", font=('Arial', 12))
+        self.games_var = tk.StringVar(value="0")
+        self.games_label = ttk.Label(self.games_frame, textvariable=self.games_var, font=('Arial', 12))
         self.games_label.pack(side=tk.LEFT, padx=(5, 0))
         
         # Win rate
@@ -55,7 +75,8 @@ class GameStatus(ttk.Frame):
         self.winrate_frame.pack(fill=tk.X)
         
         ttk.Label(self.winrate_frame, text="Win Rate:", font=('Arial', 12, 'bold')).pack(side=tk.LEFT)
-        self.winrate_label = ttk.Label(self.winrate_frame, text="0.0%", font=('Arial', 12))
+        self.winrate_var = tk.StringVar(value="0.0%")
+        self.winrate_label = ttk.Label(self.winrate_frame, textvariable=self.winrate_var, font=('Arial', 12))
         self.winrate_label.pack(side=tk.LEFT, padx=(5, 0))
     
     def update_status(self, game: BlackjackGame):
@@ -65,39 +86,33 @@ class GameStatus(ttk.Frame):
         Args:
             game: The current game state
         """
-        # Update game state
-        state_text = game.state.value.replace('_', ' ').title()
-        self.state_label.config(text=state_text)
+        # Skip the update when none of the displayed values changed since last time
+        signature = (game.state, game.current_bet_cents, game.games_played, game.get_win_rate())
+        if signature == self._status_signature:
+            return
+        self._status_signature = signature
         
-        # Color code the state
-        if game.state == GameState.BETTING:
-            self.state_label.config(foreground='#90D5FF')
-        elif game.state == GameState.PLAYER_TURN:
-            self.state_label.config(foreground='#03C40A')
-        elif game.state == GameState.DEALER_TURN:
-            self.state_label.config(foreground='#E89149')
-        elif game.state == GameState.GAME_OVER:
-            self.state_label.config(foreground='#FF6B6B')
-        else:
-            self.state_label.config(foreground='#000000')
+        # Update game state and color code it
+        self.state_var.set(_STATE_TEXT[game.state])
+        set_options(self.scheduler, self.state_label, style=_STATE_STYLE.get(game.state, NEUTRAL))
         
         # Update current bet
-        if game.current_bet > 0:
-            self.bet_label.config(text=f"${game.current_bet:.2f}")
+        if game.current_bet_cents > 0:
+            self.bet_var.set("$" + format_cents(game.current_bet_cents))
         else:
-            self.bet_label.config(text="$0.00")
+            self.bet_var.set("$0.00")
         
         # Update games played
-        self.games_label.config(text=str(game.games_played))
+        self.games_var.set(str(game.games_played))
         
         # Update win rate
         win_rate = game.get_win_rate()
-        self.winrate_label.config(text=f"{win_rate:.1%}")
+        self.winrate_var.set(format_percent(win_rate))
         
         # Color code win rate
         if win_rate > 0.5:
-            self.winrate_label.config(foreground='#03C40A')
+            set_options(self.scheduler, self.winrate_label, style=POSITIVE)
         elif win_rate < 0.4:
-            self.winrate_label.config(foreground='#FF6B6B')
+            set_options(self.scheduler, self.winrate_label, style=NEGATIVE)
         else:
-            self.winrate_label.config(foreground='#000000') 
\ No newline at end of file
+            set_options(self.scheduler, self.winrate_label, style=NEUTRAL) 
\ No newline at end of file
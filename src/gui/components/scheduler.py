@@ -0,0 +1,59 @@
+"""
+Display scheduler for batching widget option changes.
+"""
+
+import weakref
+from typing import Any, Dict, Optional
+
+
+class DisplayScheduler:
+    """Collects widget option changes from the display components and applies them in one pass."""
+
+    def __init__(self):
+        """Initialize the display scheduler."""
+        self._pending: Dict[Any, Dict[str, Any]] = {}
+        self._applied = weakref.WeakKeyDictionary()
+
+    def queue(self, widget, option: str, value: Any) -> None:
+        """
+        Queue an option change for a widget.
+
+        Later changes to the same widget option replace earlier ones.
+
+        Args:
+            widget: The widget to configure
+            option: The option name (e.g., 'style')
+            value: The new option value
+        """
+        self._pending.setdefault(widget, {})[option] = value
+
+    def set(self, widget, **options) -> None:
+        """Queue several option changes for a widget."""
+        for option, value in options.items():
+            self.queue(widget, option, value)
+
+    def flush(self) -> None:
+        """Apply all queued changes with one configure call per widget."""
+        pending, self._pending = self._pending, {}
+
+        for widget, options in pending.items():
+            applied = self._applied.setdefault(widget, {})
+            options = {option: value for option, value in options.items() if applied.get(option) != value}
+            if options:
+                widget.configure(**options)
+                applied.update(options)
+
+
+def set_options(scheduler: Optional[DisplayScheduler], widget, **options) -> None:
+    """
+    Configure a widget, deferring to the display scheduler when one is attached.
+
+    Args:
+        scheduler: The display scheduler, or None to configure the widget directly
+        widget: The widget to configure
+        **options: The option values to set
+    """
+    if scheduler is None:
+        widget.configure(**options)
+    else:
+        scheduler.set(widget, **options)
@@ -9,22 +9,27 @@ from typing import Optional, Dict, Any
 from ...game.card import Card
 from ...game.hand import Hand
 from ...strategy.calculator import StrategyCalculator, Action
+from .scheduler import DisplayScheduler, set_options
+from .styles import install_styles, POSITIVE, NEGATIVE, NEUTRAL, WARNING, INFO
 
 
 class StrategyDisplay(ttk.LabelFrame):
     """Component for displaying strategy recommendations."""
     
-    def __init__(self, parent, strategy_calculator: StrategyCalculator):
+    def __init__(self, parent, strategy_calculator: StrategyCalculator, scheduler: Optional[DisplayScheduler] = None):
         """
         Initialize the strategy display.
         
         Args:
             parent: Parent widget
             strategy_calculator: The strategy calculator
+            scheduler: Optional display scheduler used to batch widget updates
         """
         super().__init__(parent, text="Strategy", padding=10)
         self.strategy_calculator = strategy_calculator
+        self.scheduler = scheduler
         
+        install_styles(self)
         self._create_widgets()
     
     def _create_widgets(self):
@@ -34,7 +39,8 @@ class StrategyDisplay(ttk.LabelFrame):
         self.action_frame.pack(fill=tk.X, pady=(0, 10))
         
         ttk.Label(self.action_frame, text="Optimal Action:", font=('Arial', 12, 'bold')).pack(anchor=tk.W)
-        self.action_label = ttk.Label(self.action_frame, text="", font=('Arial', 14, 'bold'))
+        self.action_var = tk.StringVar(value="")
+        self.action_label = ttk.Label(self.action_frame, textvariable=self.action_var, font=('Arial', 14, 'bold'))
         self.action_label.pack(anchor=tk.W)
         
         # Expected value
@@ -42,7 +48,8 @@ class StrategyDisplay(ttk.LabelFrame):
         self.ev_frame.pack(fill=tk.X, pady=(0, 10))
         
         ttk.Label(self.ev_frame, text="Expected Value:", font=('Arial', 12, 'bold')).pack(anchor=tk.W)
-        self.ev_label = ttk.Label(self.ev_frame, text="", font=('Arial', 14))
+        self.ev_var = tk.StringVar(value="")
+        self.ev_label = ttk.Label(self.ev_frame, textvariable=self.ev_var, font=('Arial', 14))
         self.ev_label.pack(anchor=tk.W)
         
         # Basic strategy comparison
@@ -50,7 +57,8 @@ class StrategyDisplay(ttk.LabelFrame):
         self.basic_frame.pack(fill=tk.X, pady=(0, 10))
         
         ttk.Label(self.basic_frame, text="Basic Strategy:", font=('Arial', 12, 'bold')).pack(anchor=tk.W)
-        self.basic_label = ttk.Label(self.basic_frame, text="", font=('Arial', 14))
+        self.basic_var = tk.StringVar(value="")
+        self.basic_label = ttk.Label(self.basic_frame, textvariable=self.basic_var, font=('Arial', 14))
         self.basic_label.pack(anchor=tk.W)
         
         # EV difference
@@ -58,28 +66,47 @@ class StrategyDisplay(ttk.LabelFrame):
         self.diff_frame.pack(fill=tk.X, pady=(0, 10))
         
         ttk.Label(self.diff_frame, text="Count Advantage:", font=('Arial', 12, 'bold')).pack(anchor=tk.W)
-        self.diff_label = ttk.Label(self.diff_frame, text="", font=('Arial', 14))
+        self.diff_var = tk.StringVar(value="")
+        self.diff_label = ttk.Label(self.diff_frame, textvariable=self.diff_var, font=('Arial', 14))
         self.diff_label.pack(anchor=tk.W)
         
+        # Bust and insurance rows are built on first use
+        self._bust_widgets_built = False
+        self._insurance_widgets_built = False
+    
+    def _ensure_bust_widgets(self):
+        """Create the player/dealer bust probability rows on first use."""
+        if self._bust_widgets_built:
+            return
+        self._bust_widgets_built = True
+        
         # Player bust probability
         self.player_bust_frame = ttk.Frame(self)
-        self.player_bust_frame.pack(fill=tk.X, pady=(0, 5))
+        self.player_bust_frame.pack(fill=tk.X, pady=(0, 5), after=self.diff_frame)
         
         ttk.Label(self.player_bust_frame, text="Player Bust:", font=('Arial', 12, 'bold')).pack(anchor=tk.W)
-        self.player_bust_label = ttk.Label(self.player_bust_frame, text="", font=('Arial', 14))
+        self.player_bust_var = tk.StringVar(value="")
+        self.player_bust_label = ttk.Label(self.player_bust_frame, textvariable=self.player_bust_var, font=('Arial', 14))
         self.player_bust_label.pack(anchor=tk.W)
         
         # Dealer bust probability
         self.dealer_bust_frame = ttk.Frame(self)
-        self.dealer_bust_frame.pack(fill=tk.X, pady=(0, 10))
+        self.dealer_bust_frame.pack(fill=tk.X, pady=(0, 10), after=self.player_bust_frame)
         
         ttk.Label(self.dealer_bust_frame, text="Dealer Bust:", font=('Arial', 12, 'bold')).pack(anchor=tk.W)
-        self.dealer_bust_label = ttk.Label(self.dealer_bust_frame, text="", font=('Arial', 14))
+        self.dealer_bust_var = tk.StringVar(value="")
+        self.dealer_bust_label = ttk.Label(self.dealer_bust_frame, textvariable=self.dealer_bust_var, font=('Arial', 14))
         self.dealer_bust_label.pack(anchor=tk.W)
+    
+    def _ensure_insurance_widgets(self):
+        """Create the insurance recommendation row on first use (hidden by default)."""
+        if self._insurance_widgets_built:
+            return
+        self._insurance_widgets_built = True
         
-        # Insurance recommendation (hidden by default)
         self.insurance_frame = ttk.Frame(self)
-        self.insurance_label = ttk.Label(self.insurance_frame, text="", font=('Arial', 14))
+        self.insurance_var = tk.StringVar(value="")
+        self.insurance_label = ttk.Label(self.insurance_frame, textvariable=self.insurance_var, font=('Arial', 14))
         self.insurance_label.pack(anchor=tk.W)
     
     def update_strategy(self, player_hand: Hand, dealer_up_card: Card, dealer_hand: Hand = None):
@@ -91,67 +118,73 @@ class StrategyDisplay(ttk.LabelFrame):
             dealer_up_card: The dealer's up card
             dealer_hand: The dealer's full hand (optional, for bust probability calculation)
         """
+        self._ensure_bust_widgets()
+        self._ensure_insurance_widgets()
+        
         try:
             # Get strategy comparison
             strategy = self.strategy_calculator.get_strategy_comparison(player_hand, dealer_up_card)
             
             # Update optimal action
             optimal_action = strategy['optimal_action'].value.upper()
-            self.action_label.config(text=optimal_action)
+            self.action_var.set(optimal_action)
             
             # Color code the action
             if optimal_action in ['HIT', 'STAND']:
-                self.action_label.config(foreground='#90D5FF')
+                set_options(self.scheduler, self.action_label, style=INFO)
             elif optimal_action in ['DOUBLE', 'SPLIT']:
-                self.action_label.config(foreground='#03C40A')
+                set_options(self.scheduler, self.action_label, style=POSITIVE)
             elif optimal_action == 'SURRENDER':
-                self.action_label.config(foreground='#FF6B6B')
+                set_options(self.scheduler, self.action_label, style=NEGATIVE)
             else:
-                self.action_label.config(foreground='#000000')
+                set_options(self.scheduler, self.action_label, style=NEUTRAL)
             
             # Update expected value
             optimal_ev = strategy['optimal_ev']
-            self.ev_label.config(text=f"{optimal_ev:.3f}")
+            self.ev_var.set(f"{optimal_ev:.3f}")
             
             # Color code EV
             if optimal_ev > 0:
-                self.ev_label.config(foreground='#03C40A')
+                set_options(self.scheduler, self.ev_label, style=POSITIVE)
             elif optimal_ev < 0:
-                self.ev_label.config(foreground='#FF6B6B')
+                set_options(self.scheduler, self.ev_label, style=NEGATIVE)
             else:
-                self.ev_label.config(foreground='#000000')
+                set_options(self.scheduler, self.ev_label, style=NEUTRAL)
             
             # Update basic strategy
             basic_action = strategy['basic_action'].value.upper()
             basic_ev = strategy['basic_ev']
-            self.basic_label.config(text=f"{basic_action} ({basic_ev:.3f})")
+            self.basic_var.set(f"{basic_action} ({basic_ev:.3f})")
             
             # Update count advantage
             ev_difference = strategy['ev_difference']
             count_advantage = strategy['count_advantage']
             
             if count_advantage:
-                self.diff_label.config(text=f"+{ev_difference:.3f} EV", foreground='#03C40A')
+                self.diff_var.set(f"+{ev_difference:.3f} EV")
+                set_options(self.scheduler, self.diff_label, style=POSITIVE)
             else:
-                self.diff_label.config(text=f"{ev_difference:.3f} EV", foreground='#FF6B6B')
+                self.diff_var.set(f"{ev_difference:.3f} EV")
+                set_options(self.scheduler, self.diff_label, style=NEGATIVE)
             
             # Update player bust probability
             try:
                 player_bust_prob = self.strategy_calculator.get_bust_probability(player_hand.total, 'player')
                 player_bust_percentage = player_bust_prob * 100
-                self.player_bust_label.config(text=f"{player_bust_percentage:.1f}%")
+                self.player_bust_var.set(f"{player_bust_percentage:.1f}%")
                 
                 # Color code player bust probability
                 if player_bust_prob < 0.3:
-                    self.player_bust_label.config(foreground='#03C40A')
+                    set_options(self.scheduler, self.player_bust_label, style=POSITIVE)
                 elif player_bust_prob < 0.5:
-                    self.player_bust_label.config(foreground='#E89149')
+                    set_options(self.scheduler, self.player_bust_label, style=WARNING)
                 else:
-                    self.player_bust_label.config(foreground='#FF6B6B')
+                    set_options(self.scheduler, self.player_bust_label, style=NEGATIVE)
             except Exception as e:
                 print("ERROR: Bust probability calculation failed")
                 print(f'{e}: {traceback.format_exc()}')
-                self.player_bust_label.config(text="Error", foreground='#FF6B6B')
+                self.player_bust_var.set("Error")
+                set_options(self.scheduler, self.player_bust_label, style=NEGATIVE)
             
             # Update dealer bust probability
             try:
@@ -165,64 +198,69 @@ class StrategyDisplay(ttk.LabelFrame):
                     
                     dealer_bust_prob = self.strategy_calculator.get_bust_probability(dealer_visible_total, 'dealer')
                     dealer_bust_percentage = dealer_bust_prob * 100
-                    self.dealer_bust_label.config(text=f"{dealer_bust_percentage:.1f}%")
+                    self.dealer_bust_var.set(f"{dealer_bust_percentage:.1f}%")
                 else:
                     # Fallback to just the up card
                     dealer_bust_prob = self.strategy_calculator.get_bust_probability(dealer_up_card.value, 'dealer')
                     dealer_bust_percentage = dealer_bust_prob * 100
-                    self.dealer_bust_label.config(text=f"{dealer_bust_percentage:.1f}%")
+                    self.dealer_bust_var.set(f"{dealer_bust_percentage:.1f}%")
                 
                 # Color code dealer bust probability
                 if dealer_bust_prob < 0.3:
-                    self.dealer_bust_label.config(foreground='#03C40A')
+                    set_options(self.scheduler, self.dealer_bust_label, style=POSITIVE)
                 elif dealer_bust_prob < 0.5:
-                    self.dealer_bust_label.config(foreground='#E89149')
+                    set_options(self.scheduler, self.dealer_bust_label, style=WARNING)
                 else:
-                    self.dealer_bust_label.config(foreground='#FF6B6B')
+                    set_options(self.scheduler, self.dealer_bust_label, style=NEGATIVE)
             except Exception as e:
-                self.dealer_bust_label.config(text="Error", foreground='#FF6B6B')
+                self.dealer_bust_var.set("Error")
+                set_options(self.scheduler, self.dealer_bust_label, style=NEGATIVE)
             
             # Show the insurance frame if needed
             self.insurance_frame.pack(fill=tk.X, pady=(0, 10))
             
         except Exception as e:
             # Handle any errors in strategy calculation
-            self.action_label.config(text="Error", foreground='#FF6B6B')
-            self.ev_label.config(text="")   
-            self.basic_label.config(text="")
-            self.diff_label.config(text="")
+            self.action_var.set("Error")
+            set_options(self.scheduler, self.action_label, style=NEGATIVE)
+            self.ev_var.set("")
+            self.basic_var.set("")
+            self.diff_var.set("")
     
     def update_insurance_recommendation(self):
         """Update the insurance recommendation display."""
+        self._ensure_insurance_widgets()
+        
         try:
             insurance = self.strategy_calculator.get_insurance_recommendation()
             
             if insurance['should_take_insurance']:
-                self.insurance_label.config(
-                    text=f"Take Insurance (+{insurance['insurance_ev']:.3f} EV)",
-                    foreground='#03C40A'
-                )
+                self.insurance_var.set(f"Take Insurance (+{insurance['insurance_ev']:.3f} EV)")
+                set_options(self.scheduler, self.insurance_label, style=POSITIVE)
             else:
-                self.insurance_label.config(
-                    text=f"Decline Insurance ({insurance['insurance_ev']:.3f} EV)",
-                    foreground='#FF6B6B'
-                )
+                self.insurance_var.set(f"Decline Insurance ({insurance['insurance_ev']:.3f} EV)")
+                set_options(self.scheduler, self.insurance_label, style=NEGATIVE)
             
             # Show the insurance frame
             self.insurance_frame.pack(fill=tk.X, pady=(0, 10))
             
         except Exception as e:
-            self.insurance_label.config(text="Insurance: Error", foreground='#FF6B6B')
+            self.insurance_var.set("Insurance: Error")
+            set_options(self.scheduler, self.insurance_label, style=NEGATIVE)
     
     def clear_strategy(self):
         """Clear the strategy display."""
-        self.action_label.config(text="")
-        self.ev_label.config(text="")
-        self.basic_label.config(text="")
-        self.diff_label.config(text="")
-        self.player_bust_label.config(text="")
-        self.dealer_bust_label.config(text="")
-        self.insurance_label.config(text="")
-        
-        # Hide insurance frame
-        self.insurance_frame.pack_forget() 
\ No newline at end of file
+        self.action_var.set("")
+        self.ev_var.set("")
+        self.basic_var.set("")
+        self.diff_var.set("")
+        
+        if self._bust_widgets_built:
+            self.player_bust_var.set("")
+            self.dealer_bust_var.set("")
+        
+        if self._insurance_widgets_built:
+            self.insurance_var.set("")
+            
+            # Hide insurance frame
+            self.insurance_frame.pack_forget() 
\ No newline at end of file
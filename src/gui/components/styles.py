@@ -0,0 +1,40 @@
+"""
+Shared ttk label styles for the display components.
+"""
+
+from tkinter import ttk
+
+# Named label styles used to color code values
+POSITIVE = 'Pos.TLabel'
+NEGATIVE = 'Neg.TLabel'
+NEUTRAL = 'Neutral.TLabel'
+WARNING = 'Warn.TLabel'
+INFO = 'Info.TLabel'
+
+_STYLE_COLORS = {
+    POSITIVE: '#03C40A',
+    NEGATIVE: '#FF6B6B',
+    NEUTRAL: '#000000',
+    WARNING: '#E89149',
+    INFO: '#90D5FF',
+}
+
+_styles_installed = False
+
+
+def install_styles(master) -> None:
+    """
+    Configure the named label styles once per process.
+
+    Args:
+        master: Any widget belonging to the Tk application
+    """
+    global _styles_installed
+    if _styles_installed:
+        return
+
+    style = ttk.Style(master)
+    for name, color in _STYLE_COLORS.items():
+        style.configure(name, foreground=color)
+
+    _styles_installed = True
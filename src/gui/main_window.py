@@ -5,25 +5,103 @@ Main GUI window for the Blackjack game.
 import tkinter as tk
 from tkinter import ttk, messagebox
 from typing import Optional, Dict, Any
-import threading
-import time
+from contextlib import contextmanager
+import logging
 import os
+from PIL import Image, ImageDraw, ImageTk
 
 from ..game.game import BlackjackGame, GameState, GameResult
 from ..game.card import Card, Suit, Rank
 from ..game.hand import Hand
-from .components.card_display import CardDisplay
+from .components.card_display import CardDisplay, load_card_images
 from .components.count_display import CountDisplay
 from .components.strategy_display import StrategyDisplay
 from .components.betting_panel import BettingPanel
 from .components.action_panel import ActionPanel
 from .components.game_status import GameStatus
+from .components.scheduler import DisplayScheduler
 from .start_screen import StartScreen
-from ..utils.utils import draw_rounded_rect
+from ..utils.utils import format_cents, format_money, format_percent
+
+_log = logging.getLogger(__name__)
+
+# Precomputed display labels for game states and results
+_STATE_LABELS = {state: state.value.title() for state in GameState}
+_RESULT_LABELS = {result: result.value.replace('_', ' ').title() for result in GameResult}
+
+# States in which the dealer's face-down card is shown
+_HOLE_CARD_VISIBLE_STATES = frozenset({GameState.GAME_OVER, GameState.DEALER_TURN})
+
+# Custom styles for the application, applied in one theme_settings call
+_APP_STYLES = {
+    "TLabelframe": {
+        "configure": {"background": "#3a3a3a",
+                      "bordercolor": "#555555",
+                      "lightcolor": "#555555",
+                      "darkcolor": "#555555"},
+    },
+    "TLabelframe.Label": {
+        "configure": {"background": "#3a3a3a",
+                      "foreground": "white",
+                      "font": ('Arial', 16, 'bold')},
+    },
+    "TFrame": {
+        "configure": {"background": "#3a3a3a"},
+    },
+    "TLabel": {
+        "configure": {"background": "#3a3a3a",
+                      "foreground": "white"},
+    },
+    "Status.TLabel": {
+        "configure": {"relief": tk.SUNKEN},
+    },
+    "TButton": {
+        "configure": {"background": "#555555",
+                      "foreground": "white",
+                      "bordercolor": "#777777",
+                      "lightcolor": "#777777",
+                      "darkcolor": "#333333"},
+        # Map styles for different states
+        "map": {"background": [('active', '#666666'), ('pressed', '#444444')],
+                "foreground": [('active', '#FFFFFF'), ('pressed', '#FFFFFF')]},
+    },
+    "Accent.TButton": {
+        "configure": {"background": "#4CAF50",
+                      "foreground": "white",
+                      "bordercolor": "#45a049",
+                      "lightcolor": "#45a049",
+                      "darkcolor": "#3d8b40"},
+        "map": {"background": [('active', '#45a049'), ('pressed', '#3d8b40')],
+                "foreground": [('active', '#FFFFFF'), ('pressed', '#FFFFFF')]},
+    },
+    "Start.Accent.TButton": {
+        "configure": {"font": ('Arial', 16, 'bold'),
+                      "padding": (10, 12)},
+    },
+    "Secondary.TButton": {
+        "configure": {"background": "#f44336",
+                      "foreground": "white",
+                      "bordercolor": "#da190b",
+                      "lightcolor": "#da190b",
+                      "darkcolor": "#c62828"},
+        "map": {"background": [('active', '#da190b'), ('pressed', '#c62828')],
+                "foreground": [('active', '#FFFFFF'), ('pressed', '#FFFFFF')]},
+    },
+}
 
 class BlackjackGUI:
     """Main GUI window for the Blackjack game."""
     
+    # Whether _APP_STYLES has been applied to the current theme
+    _styles_initialized = False
+    
+    # Rounded menu button images, kept alive for the ttk element that uses them
+    _MENU_BUTTON_IMAGES = None
+    
+    # Window icon path and image, resolved and decoded once and shared across windows
+    _ICON_PATH = None
+    _ICON_PHOTO = None
+    
     def __init__(self, num_decks: int = 6, min_bet: int = 10, max_bet: int = 1000):
         """
         Initialize the GUI.
@@ -44,61 +122,12 @@ class BlackjackGUI:
         self.root.geometry("1600x1200")
         self.root.configure(bg='#2c5530')  # Dark green background
 
-        # Set up ttk style
+        # Set up ttk style; the application styles only need configuring once per process
         self.style = ttk.Style()
-        
-        # Configure custom styles for the application
-        self.style.configure("TLabelframe", 
-                           background="#3a3a3a", 
-                           bordercolor="#555555",
-                           lightcolor="#555555",
-                           darkcolor="#555555")
-        
-        self.style.configure("TLabelframe.Label", 
-                           background="#3a3a3a", 
-                           foreground="white",
-                           font=('Arial', 16, 'bold'))
-        
-        self.style.configure("TFrame", 
-                           background="#3a3a3a")
-        
-        self.style.configure("TLabel", 
-                           background="#3a3a3a", 
-                           foreground="white")
-        
-        self.style.configure("TButton", 
-                           background="#555555", 
-                           foreground="white",
-                           bordercolor="#777777",
-                           lightcolor="#777777",
-                           darkcolor="#333333")
-        
-        self.style.configure("Accent.TButton", 
-                           background="#4CAF50", 
-                           foreground="white",
-                           bordercolor="#45a049",
-                           lightcolor="#45a049",
-                           darkcolor="#3d8b40")
-        
-        self.style.configure("Secondary.TButton", 
-                           background="#f44336", 
-                           foreground="white",
-                           bordercolor="#da190b",
-                           lightcolor="#da190b",
-                           darkcolor="#c62828")
-        
-        # Map styles for different states
-        self.style.map("TButton",
-                      background=[('active', '#666666'), ('pressed', '#444444')],
-                      foreground=[('active', '#FFFFFF'), ('pressed', '#FFFFFF')])
-        
-        self.style.map("Accent.TButton",
-                      background=[('active', '#45a049'), ('pressed', '#3d8b40')],
-                      foreground=[('active', '#FFFFFF'), ('pressed', '#FFFFFF')])
-        
-        self.style.map("Secondary.TButton",
-                      background=[('active', '#da190b'), ('pressed', '#c62828')],
-                      foreground=[('active', '#FFFFFF'), ('pressed', '#FFFFFF')])
+        if not BlackjackGUI._styles_initialized:
+            self.style.theme_settings(self.style.theme_use(), _APP_STYLES)
+            self._create_rounded_button_style()
+            BlackjackGUI._styles_initialized = True
         
         # Set window icon
         self._set_window_icon()
@@ -106,68 +135,134 @@ class BlackjackGUI:
         # Initialize UI state
         self.current_screen = "start"
         self.game_components = {}
+        self.start_screen = None
+        self._game_built = False
+        
+        # Persistent containers for the start and game screens, swapped on navigation
+        self._start_container = tk.Frame(self.root, bg=self.root.cget("bg"))
+        self._game_container = tk.Frame(self.root, bg=self.root.cget("bg"))
+        self._configure_root_grid()
+        
+        # Display refresh batching state
+        self._update_depth = 0
+        self._update_dirty = False
+        self._last_status_text = None
+        self._last_strategy_key = None
+        
+        # Pending after() callbacks, cancelled when leaving the game screen
+        self._after_ids = set()
+        
+        # Number of dealer cards revealed so far while the dealer's turn plays out
+        self._dealer_cards_shown = None
+        
+        # Cards dealt in the current deal animation that have not been counted yet
+        self._dealt_cards = []
         
         # Show start screen
         self._show_start_screen()
     
+    def _create_rounded_button_style(self):
+        """Create the Rounded.TButton style from stretchable rounded rectangle images."""
+        def rounded_image(fill, outline):
+            image = Image.new("RGBA", (160, 44), (0, 0, 0, 0))
+            ImageDraw.Draw(image).rounded_rectangle((2, 2, 157, 41), radius=16, fill=fill, outline=outline, width=2)
+            return ImageTk.PhotoImage(image, master=self.root)
+        
+        normal = rounded_image("#e0e0e0", "#b0b0b0")
+        hover = rounded_image("#d0d0d0", "#a0a0a0")
+        BlackjackGUI._MENU_BUTTON_IMAGES = (normal, hover)
+        
+        # The 18px border keeps the corners intact while the middle stretches
+        self.style.element_create("RoundedButton.border", "image", normal,
+                                  ("active", hover), border=18, sticky="nsew")
+        self.style.layout("Rounded.TButton", [
+            ("RoundedButton.border", {"sticky": "nsew", "children": [
+                ("Button.padding", {"sticky": "nsew", "children": [
+                    ("Button.label", {"sticky": "nsew"})
+                ]})
+            ]})
+        ])
+        self.style.configure("Rounded.TButton",
+                             font=('Arial', 12, 'bold'),
+                             foreground='#333333',
+                             background=self.root.cget("bg"),
+                             padding=(16, 10))
+        self.style.map("Rounded.TButton",
+                       foreground=[('active', '#222222')])
+    
     def _set_window_icon(self):
         """Set the window icon."""
-        try:
-            # Try to set icon from various possible locations
-            icon_paths = [
-                "src/gui/assets/icon.png",                 # Your PNG icon file (preferred)
-                "src/gui/assets/BlackjackIconGreen.icns",  # Your specific icon file
-                "src/gui/assets/icon.icns",                # Standard name
-                "src/gui/assets/icon.ico",                 # Windows
-                "assets/icon.png",                         # Fallback locations
-                "assets/icon.icns",
-                "assets/icon.ico"
+        # Reuse the icon decoded by a previous window if there is one
+        if BlackjackGUI._ICON_PHOTO is not None:
+            try:
+                self.root.iconphoto(True, BlackjackGUI._ICON_PHOTO)
+                return
+            except tk.TclError:
+                # The cached image belonged to a destroyed Tk interpreter
+                BlackjackGUI._ICON_PHOTO = None
+        
+        # Try the previously resolved path first, then search the assets directory
+        if BlackjackGUI._ICON_PATH is not None:
+            icon_paths = [BlackjackGUI._ICON_PATH]
+        else:
+            assets_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+            icon_names = [
+                "icon.png",                 # PNG icon file (preferred)
+                "BlackjackIconGreen.icns",  # Specific macOS icon file
+                "icon.icns",                # Standard name
+                "icon.ico"                  # Windows
             ]
-            
-            for icon_path in icon_paths:
-                if os.path.exists(icon_path):
-                    try:
-                        if icon_path.endswith('.icns') or icon_path.endswith('.png'):
-                            # For .icns and .png files, use iconphoto method
-                            from PIL import Image, ImageTk
-                            img = Image.open(icon_path)
-                            photo = ImageTk.PhotoImage(img)
-                            self.root.iconphoto(True, photo)
-                            break
-                        else:
-                            # For other formats, use iconbitmap
-                            self.root.iconbitmap(icon_path)
-                            break
-                    except Exception as icon_error:
-                        print(f"Failed to load icon from {icon_path}: {icon_error}")
-                        continue
-        except Exception as e:
-            print(f"Icon setting failed: {e}")
-            # Icon setting failed, continue without icon
-            pass
+            icon_paths = [os.path.join(assets_dir, icon_name) for icon_name in icon_names]
+        
+        for icon_path in icon_paths:
+            if not os.path.exists(icon_path):
+                continue
+            try:
+                if icon_path.endswith('.icns') or icon_path.endswith('.png'):
+                    # For .icns and .png files, use iconphoto method; the source art is far
+                    # larger than any window icon, so shrink it before handing it to Tk
+                    image = Image.open(icon_path)
+                    image.thumbnail((128, 128), Image.Resampling.LANCZOS)
+                    photo = ImageTk.PhotoImage(image)
+                    self.root.iconphoto(True, photo)
+                    BlackjackGUI._ICON_PHOTO = photo
+                else:
+                    # For other formats, use iconbitmap
+                    self.root.iconbitmap(icon_path)
+                BlackjackGUI._ICON_PATH = icon_path
+                _log.debug("Icon loaded from %s", icon_path)
+                break
+            except Exception as icon_error:
+                _log.warning("Failed to load icon from %s: %s", icon_path, icon_error)
+                continue
     
     def _create_components(self):
         """Create all GUI components."""
         # Create frames first
-        self.left_frame = ttk.Frame(self.root)
-        self.center_frame = ttk.Frame(self.root)
-        self.right_frame = ttk.Frame(self.root)
+        self.left_frame = ttk.Frame(self._game_container)
+        self.center_frame = ttk.Frame(self._game_container)
+        self.right_frame = ttk.Frame(self._game_container)
+        
+        # Shared scheduler that batches display widget updates
+        self.display_scheduler = DisplayScheduler()
         
         # Left panel - Count and Strategy
-        self.count_display = CountDisplay(self.left_frame, self.game.card_counter)
-        self.strategy_display = StrategyDisplay(self.left_frame, self.game.strategy_calculator)
+        self.count_display = CountDisplay(self.left_frame, self.game.card_counter, self.display_scheduler)
+        self.strategy_display = StrategyDisplay(self.left_frame, self.game.strategy_calculator, self.display_scheduler)
         
         # Center panel - Game area
-        self.game_status = GameStatus(self.center_frame)
-        self.dealer_display = CardDisplay(self.center_frame, "Dealer")
-        self.player_display = CardDisplay(self.center_frame, "Player")
+        self.game_status = GameStatus(self.center_frame, self.display_scheduler)
+        card_images = load_card_images()
+        self.dealer_display = CardDisplay(self.center_frame, "Dealer", images=card_images)
+        self.player_display = CardDisplay(self.center_frame, "Player", images=card_images)
         
         # Right panel - Betting and Actions
-        self.betting_panel = BettingPanel(self.right_frame, self.min_bet, self.max_bet, self.game.player_bankroll)
+        self.betting_panel = BettingPanel(self.right_frame, self.min_bet, self.max_bet, self.game.player_bankroll_cents)
         self.action_panel = ActionPanel(self.right_frame)
         
         # Status bar
-        self.status_bar = ttk.Label(self.root, text="Ready to play", relief=tk.SUNKEN)
+        self.status_var = tk.StringVar(value="Ready to play")
+        self.status_bar = ttk.Label(self._game_container, textvariable=self.status_var, style="Status.TLabel")
     
     def _layout_components(self):
         """Layout all components in the window."""
@@ -196,36 +291,8 @@ class BlackjackGUI:
         self.action_panel.pack(fill=tk.BOTH, expand=True)
         
         # Menu button with rounded corners - positioned above the left panel
-        menu_btn_canvas = tk.Canvas(self.root, width=160, height=44, highlightthickness=0, bg=self.root.cget("bg"))
-        menu_btn_canvas.grid(row=0, column=0, sticky="nw", padx=10, pady=(10, 0))
-        
-        # Store references to canvas items for hover effects
-        menu_btn_canvas.background_shape = None
-        menu_btn_canvas.button_text = None
-        
-        # Draw the rounded rectangle background
-        menu_btn_canvas.background_shape = draw_rounded_rect(menu_btn_canvas, 2, 2, 158, 42, 16, fill="#e0e0e0", outline="#b0b0b0", width=2)
-        
-        # Create button text as a canvas item instead of a separate button
-        menu_btn_canvas.button_text = menu_btn_canvas.create_text(80, 22, text="← Back to Menu", font=('Arial', 12, 'bold'), fill='#333333')
-        
-        # Bind click events to the canvas
-        def on_click(event):
-            self._back_to_menu()
-        
-        def on_enter(event):
-            # Update background color without redrawing
-            menu_btn_canvas.itemconfig(menu_btn_canvas.background_shape, fill="#d0d0d0", outline="#a0a0a0")
-            menu_btn_canvas.itemconfig(menu_btn_canvas.button_text, fill='#222222')
-        
-        def on_leave(event):
-            # Update background color without redrawing
-            menu_btn_canvas.itemconfig(menu_btn_canvas.background_shape, fill="#e0e0e0", outline="#b0b0b0")
-            menu_btn_canvas.itemconfig(menu_btn_canvas.button_text, fill='#333333')
-        
-        menu_btn_canvas.bind('<Button-1>', on_click)
-        menu_btn_canvas.bind('<Enter>', on_enter)
-        menu_btn_canvas.bind('<Leave>', on_leave)
+        menu_button = ttk.Button(self._game_container, text="← Back to Menu", style="Rounded.TButton", command=self._back_to_menu)
+        menu_button.grid(row=0, column=0, sticky="nw", padx=10, pady=(10, 0))
         
         # Status bar
         self.status_bar.grid(row=3, column=0, columnspan=3, sticky="ew", padx=10, pady=(0, 10))
@@ -250,18 +317,29 @@ class BlackjackGUI:
     
     def _back_to_menu(self):
         """Return to the start screen."""
+        # Nothing to lose between hands, so skip the confirmation dialog
+        if self.game is None or (self.game.state == GameState.BETTING and self.game.current_bet == 0):
+            self._show_start_screen()
+            return
+        
         if messagebox.askyesno("Back to Menu", "Are you sure you want to return to the menu? Current game progress will be lost."):
             self._show_start_screen()
     
     def _show_start_screen(self):
         """Show the start screen."""
-        # Clear any existing widgets
-        for widget in self.root.winfo_children():
-            widget.destroy()
-        
-        # Create and show start screen
-        self.start_screen = StartScreen(self.root, self._on_start_game)
-        self.start_screen.pack(fill=tk.BOTH, expand=True)
+        self.current_screen = "start"
+        self._cancel_scheduled()
+        self._dealer_cards_shown = None
+        if self._game_built:
+            self._reset_strategy()
+        self._game_container.grid_remove()
+        
+        # Create the start screen the first time it is shown
+        if self.start_screen is None:
+            self.start_screen = StartScreen(self._start_container, self._on_start_game)
+            self.start_screen.pack(fill=tk.BOTH, expand=True)
+        
+        self._start_container.grid(row=0, column=0, sticky="nsew")
     
     def _on_start_game(self, bankroll: int, num_decks: int):
         """Handle start game button click."""
@@ -277,113 +355,144 @@ class BlackjackGUI:
     
     def _show_game_screen(self):
         """Show the main game screen."""
-        # Clear start screen
-        for widget in self.root.winfo_children():
-            widget.destroy()
+        self.current_screen = "game"
+        self._start_container.grid_remove()
         
-        # Configure grid weights for game layout
-        self.root.grid_rowconfigure(0, weight=0)  # Menu button row (fixed height)
-        self.root.grid_rowconfigure(1, weight=1)  # Top section
-        self.root.grid_rowconfigure(2, weight=2)  # Middle section (game area)
-        self.root.grid_rowconfigure(3, weight=1)  # Bottom section
+        # Build the game components once and reuse them for later games
+        self._ensure_game_screen_built()
+        self._attach_game()
+        
+        self._game_container.grid(row=0, column=0, sticky="nsew")
+        
+        # Update display
+        self._update_display()
+    
+    def _configure_root_grid(self):
+        """Set the static grid weights for the window and the game layout."""
+        # Both screen containers fill the window
+        self.root.grid_rowconfigure(0, weight=1)
         self.root.grid_columnconfigure(0, weight=1)
-        self.root.grid_columnconfigure(1, weight=3)  # Game area
-        self.root.grid_columnconfigure(2, weight=1)
+        
+        # Configure grid weights for game layout
+        self._game_container.grid_rowconfigure(0, weight=0)  # Menu button row (fixed height)
+        self._game_container.grid_rowconfigure(1, weight=1)  # Top section
+        self._game_container.grid_rowconfigure(2, weight=2)  # Middle section (game area)
+        self._game_container.grid_rowconfigure(3, weight=1)  # Bottom section
+        self._game_container.grid_columnconfigure(0, weight=1)
+        self._game_container.grid_columnconfigure(1, weight=3)  # Game area
+        self._game_container.grid_columnconfigure(2, weight=1)
+    
+    def _ensure_game_screen_built(self):
+        """Lay out and create the game screen components the first time they are needed."""
+        if self._game_built:
+            return
         
         # Initialize game components
         self._create_components()
         self._layout_components()
         self._bind_events()
         
-        # Update display
-        self._update_display()
+        self._game_built = True
+    
+    def _attach_game(self):
+        """Point the existing game components at the current game."""
+        self.count_display.card_counter = self.game.card_counter
+        self.strategy_display.strategy_calculator = self.game.strategy_calculator
     
     def _on_bet_placed(self, amount: int):
         """Handle bet placement."""
-        if self.game.place_bet(amount):
-            self._update_display()
-            # Start the animated dealing process
-            self._deal_cards_with_animation()
-        else:
-            messagebox.showerror("Error", "Invalid bet amount!")
+        with self._batched_updates():
+            if self.game.place_bet(amount):
+                # Start the animated dealing process; the first dealt card triggers the refresh
+                self._deal_cards_with_animation()
+            else:
+                messagebox.showerror("Error", "Invalid bet amount!")
     
     def _on_hit(self):
         """Handle hit action."""
-        if self.game.hit():
-            self._update_display()
-            
-            # Check if we automatically stood on 21
-            current_hand = self.game.get_current_hand()
-            if current_hand and current_hand.total == 21 and not current_hand.is_blackjack:
-                # Show a brief message that we automatically stood
-                self._show_auto_stand_message()
-            
-            # Add a small delay before checking if dealer should play
-            self.root.after(500, self._check_dealer_turn)
-        else:
-            messagebox.showerror("Error", "Cannot hit!")
-    
-    def _check_dealer_turn(self):
-        """Check if it's the dealer's turn after player action."""
-        if self.game.state == GameState.DEALER_TURN:
-            self._play_dealer_hand()
+        with self._batched_updates():
+            if self.game.hit():
+                self._update_display()
+                
+                # Check if we automatically stood on 21
+                current_hand = self.game.get_current_hand()
+                if current_hand and current_hand.total == 21 and not current_hand.is_blackjack:
+                    # Show a brief message that we automatically stood
+                    self._show_auto_stand_message()
+                
+                # Add a small delay before the dealer plays, if it is the dealer's turn
+                if self.game.state == GameState.DEALER_TURN:
+                    self._schedule(500, self._play_dealer_hand)
+            else:
+                messagebox.showerror("Error", "Cannot hit!")
     
     def _on_stand(self):
         """Handle stand action."""
-        if self.game.stand():
-            self._update_display()
-            # Add a small delay before dealer plays
-            self.root.after(500, self._check_dealer_turn)
-        else:
-            messagebox.showerror("Error", "Cannot stand!")
+        with self._batched_updates():
+            if self.game.stand():
+                self._update_display()
+                # Add a small delay before dealer plays
+                if self.game.state == GameState.DEALER_TURN:
+                    self._schedule(500, self._play_dealer_hand)
+            else:
+                messagebox.showerror("Error", "Cannot stand!")
     
     def _on_double(self):
         """Handle double down action."""
-        if self.game.double_down():
-            self._update_display()
-            # Add a small delay before dealer plays
-            self.root.after(500, self._check_dealer_turn)
-        else:
-            messagebox.showerror("Error", "Cannot double down!")
+        with self._batched_updates():
+            if self.game.double_down():
+                self._update_display()
+                # Add a small delay before dealer plays
+                if self.game.state == GameState.DEALER_TURN:
+                    self._schedule(500, self._play_dealer_hand)
+            else:
+                messagebox.showerror("Error", "Cannot double down!")
     
     def _on_split(self):
         """Handle split action."""
-        if self.game.split():
-            self._update_display()
-        else:
-            messagebox.showerror("Error", "Cannot split!")
+        with self._batched_updates():
+            if self.game.split():
+                self._update_display()
+            else:
+                messagebox.showerror("Error", "Cannot split!")
     
     def _on_surrender(self):
         """Handle surrender action."""
-        if self.game.surrender():
-            self._update_display()
-            # Add a small delay before dealer plays
-            self.root.after(500, self._check_dealer_turn)
-        else:
-            messagebox.showerror("Error", "Cannot surrender!")
+        with self._batched_updates():
+            if self.game.surrender():
+                self._update_display()
+                # Add a small delay before dealer plays
+                if self.game.state == GameState.DEALER_TURN:
+                    self._schedule(500, self._play_dealer_hand)
+            else:
+                messagebox.showerror("Error", "Cannot surrender!")
     
     def _on_insurance(self, amount: int):
         """Handle insurance bet."""
-        if self.game.place_insurance(amount):
-            self._update_display()
-            if self.game.state == GameState.GAME_OVER:
-                self._show_results()
-        else:
-            messagebox.showerror("Error", "Invalid insurance amount!")
+        with self._batched_updates():
+            if self.game.place_insurance(amount):
+                self._update_display()
+                if self.game.state == GameState.GAME_OVER:
+                    self._show_results()
+            else:
+                messagebox.showerror("Error", "Invalid insurance amount!")
     
     def _on_decline_insurance(self):
         """Handle declining insurance."""
-        if self.game.decline_insurance():
-            self._update_display()
-            if self.game.state == GameState.GAME_OVER:
-                self._show_results()
-        else:
-            messagebox.showerror("Error", "Failed to decline insurance!")
+        with self._batched_updates():
+            if self.game.decline_insurance():
+                self._update_display()
+                if self.game.state == GameState.GAME_OVER:
+                    self._show_results()
+            else:
+                messagebox.showerror("Error", "Failed to decline insurance!")
     
     def _on_new_hand(self):
         """Handle starting a new hand."""
-        self.game.start_new_hand()
-        self._update_display()
+        with self._batched_updates():
+            self.game.start_new_hand()
+            self._reset_strategy()
+            self._update_display()
     
     def _deal_cards_with_animation(self):
         """Deal cards with animation delays for a more natural feel."""
@@ -396,10 +505,13 @@ class BlackjackGUI:
             self.game.deck.shuffle()
             self.game.card_counter.reset(self.game.deck)
         
+        # Cards dealt during the animation are counted together once the deal is complete
+        self._dealt_cards = []
+        
         # Burn a card (casino practice)
         burned_card = self.game.deck.burn_card()
         if burned_card:
-            self.game.card_counter.update_count(burned_card)
+            self._dealt_cards.append(burned_card)
         
         # Clear previous hands
         self.game.player_hands = [Hand()]
@@ -410,8 +522,15 @@ class BlackjackGUI:
         self._deal_next_card(0, 0)
     
     def _deal_next_card(self, round_num: int, card_in_round: int):
-        """Deal the next card in the sequence with animation."""
+        """Deal the next card in the sequence with animation (a timer step, see _update_display)."""
+        if self.current_screen != "game":
+            return
+        
         if round_num >= 2:  # All cards dealt
+            # Count the burned and dealt cards in one go
+            self.game.card_counter.update_count_multiple(self._dealt_cards)
+            self._dealt_cards = []
+            
             # Check for insurance opportunity
             if len(self.game.dealer_hand.cards) >= 2 and self.game.dealer_hand.cards[1].is_ace:
                 self.game.state = GameState.INSURANCE
@@ -445,19 +564,19 @@ class BlackjackGUI:
             card = self.game.deck.deal_card()
             if card:
                 self.game.player_hands[0].add_card(card)
-                self.game.card_counter.update_count(card)
+                self._dealt_cards.append(card)
                 self._update_display()
                 # Schedule next card (dealer's card in this round)
-                self.root.after(800, lambda: self._deal_next_card(round_num, 1))
+                self._schedule(800, self._deal_next_card, round_num, 1)
         else:  # Second card in this round (dealer's card)
             # Deal to dealer
             card = self.game.deck.deal_card()
             if card:
                 self.game.dealer_hand.add_card(card)
-                self.game.card_counter.update_count(card)
+                self._dealt_cards.append(card)
                 self._update_display()
                 # Schedule next round
-                self.root.after(800, lambda: self._deal_next_card(round_num + 1, 0))
+                self._schedule(800, self._deal_next_card, round_num + 1, 0)
     
     def _check_insurance(self):
         """Check if insurance is available."""
@@ -466,80 +585,137 @@ class BlackjackGUI:
             self.action_panel.show_insurance_options(max_insurance)
     
     def _play_dealer_hand(self):
-        """Play out the dealer's hand with step-by-step animation."""
+        """Play out the dealer's hand, then reveal the drawn cards step by step (timer steps, see _update_display)."""
+        if self.current_screen != "game":
+            return
+        
         # Check if any player hands are still in play (not busted)
         active_hands = [hand for hand in self.game.player_hands if not hand.is_bust and not hand.is_surrendered]
         
         # If all hands are busted or surrendered, dealer doesn't need to play
         if not active_hands:
-            self.game.state = GameState.GAME_OVER
-            self._show_results()
+            self._finish_dealer_turn()
             return
         
-        # Set game state to dealer turn and start with revealing the face-down card
-        self.game.state = GameState.DEALER_TURN
-        self._dealer_play_step(reveal_hole_card=True)
+        # Let the game draw the dealer's whole hand up front, keeping the
+        # dealer's turn on screen until every drawn card has been revealed
+        self._dealer_cards_shown = len(self.game.dealer_hand.cards)
+        self.game.play_dealer_hand(finish=False)
+        
+        # First step: reveal the face-down card
+        self._update_display()
+        self._schedule(1500, self._reveal_dealer_card)
     
-    def _dealer_play_step(self, reveal_hole_card=False):
-        """Play one step of the dealer's hand."""
-        if reveal_hole_card:
-            # First step: reveal the face-down card
-            self._update_display()
-            
-            # Schedule the actual dealer play after a delay
-            self.root.after(1500, lambda: self._dealer_play_step(reveal_hole_card=False))
+    def _reveal_dealer_card(self):
+        """Show the next card the dealer drew, or finish once all are shown."""
+        if self.current_screen != "game":
             return
         
-        # Use the exact same logic as the original play_dealer_hand method
-        should_hit = (self.game.dealer_hand.total < 17 or 
-                     (self.game.dealer_hits_soft_17 and self.game.dealer_hand.is_soft and self.game.dealer_hand.total == 17))
-        
-        if should_hit:
-            # Deal one card to dealer
-            card = self.game.deck.deal_card()
-            if card:
-                self.game.dealer_hand.add_card(card)
-                self.game.card_counter.update_count(card)
-                
-                # Update display to show the new card
-                self._update_display()
-                
-                # Schedule next step after a delay
-                self.root.after(2000, lambda: self._dealer_play_step(reveal_hole_card=False))
-            else:
-                # No more cards in deck
-                self.game.state = GameState.GAME_OVER
-                self._show_results()
-        else:
+        if self._dealer_cards_shown >= len(self.game.dealer_hand.cards):
             # Dealer stands
-            self.game.state = GameState.GAME_OVER
-            self._show_results()
+            self._dealer_cards_shown = None
+            self._finish_dealer_turn()
+            return
+        
+        # Update display to show the new card
+        self._dealer_cards_shown += 1
+        self._update_display()
+        
+        # Schedule next step after a delay
+        self._schedule(2000, self._reveal_dealer_card)
+    
+    def _finish_dealer_turn(self):
+        """End the dealer's turn and show the results."""
+        self.game.finish_dealer_turn()
+        self._show_results()
     
     def _show_results(self):
         """Show game results."""
+        if self.current_screen != "game":
+            return
+        
         results = self.game.determine_results()
         self.game.update_statistics(results)
-        self._update_display()
+        
+        # Render now, even inside a batch, since the dialog below blocks
+        self._flush_display()
         
         # Show results dialog
-        result_text = "Game Results:\n\n"
+        parts = ["Game Results:\n\n"]
         for i, (hand, result, payout) in enumerate(results):
-            result_text += f"Hand {i+1}: {result.value.replace('_', ' ').title()}\n"
+            parts.append(f"Hand {i+1}: {_RESULT_LABELS[result]}\n")
             if payout > 0:
-                result_text += f"Payout: ${payout:.2f}\n"
-            result_text += "\n"
+                parts.append(f"Payout: ${format_money(payout)}\n")
+            parts.append("\n")
+        result_text = "".join(parts)
         
         messagebox.showinfo("Game Results", result_text)
     
+    def _schedule(self, delay: int, callback, *args):
+        """Run callback(*args) after a delay, unless the game screen is left first."""
+        def run():
+            self._after_ids.discard(after_id)
+            callback(*args)
+        
+        after_id = self.root.after(delay, run)
+        self._after_ids.add(after_id)
+    
+    def _cancel_scheduled(self):
+        """Cancel every pending callback registered with _schedule."""
+        for after_id in self._after_ids:
+            self.root.after_cancel(after_id)
+        self._after_ids.clear()
+    
+    @contextmanager
+    def _batched_updates(self):
+        """
+        Defer display refreshes until the outermost batch exits, then refresh once.
+        
+        Action handlers wrap their game changes in a batch, so a click that changes
+        the game several times still repaints only once, before control returns
+        to the event loop.
+        """
+        self._update_depth += 1
+        try:
+            yield
+        finally:
+            self._update_depth -= 1
+            if self._update_depth == 0 and self._update_dirty:
+                self._flush_display()
+    
     def _update_display(self):
+        """
+        Refresh the display, or mark it dirty while a batch is open.
+        
+        Inside an action handler's batch this only records that a refresh is due.
+        The deal and dealer-reveal timer steps run outside any batch and make one
+        change each, so they repaint right away, before the next delay starts.
+        """
+        self._update_dirty = True
+        if self._update_depth == 0:
+            self._flush_display()
+    
+    def _flush_display(self):
+        """Refresh the display immediately and clear the dirty flag."""
+        self._update_dirty = False
+        self._do_update_display()
+    
+    def _do_update_display(self):
         """Update all display components."""
+        # Components may be stale or hidden once we are back on the start screen
+        if self.current_screen != "game":
+            return
+        
         # Update game status
         self.game_status.update_status(self.game)
         
-        # Update dealer display
+        # Update dealer display, limited to the cards revealed so far during the dealer's turn
+        dealer_hand = self.game.dealer_hand
+        if self._dealer_cards_shown is not None:
+            dealer_hand = Hand(dealer_hand.cards[:self._dealer_cards_shown])
         self.dealer_display.update_hand(
-            self.game.dealer_hand,
-            hide_first=(self.game.state not in [GameState.GAME_OVER, GameState.DEALER_TURN])
+            dealer_hand,
+            hide_first=(self.game.state not in _HOLE_CARD_VISIBLE_STATES)
         )
         
         # Update player display
@@ -548,30 +724,53 @@ class BlackjackGUI:
             self.game.current_hand_index
         )
         
-        # Update count display
-        self.count_display.update_count(self.game.card_counter)
+        # Update count display, holding it back until the dealer's drawn cards are all on the table
+        if self._dealer_cards_shown is None:
+            self.count_display.update_count(self.game.card_counter)
         
-        # Update strategy display
+        # Update strategy display, recomputing only when the inputs it depends on change
         if self.game.state == GameState.PLAYER_TURN:
             current_hand = self.game.get_current_hand()
             if current_hand and self.game.dealer_hand.cards:
                 dealer_up = self.game.dealer_hand.cards[1]
-                self.strategy_display.update_strategy(current_hand, dealer_up, self.game.dealer_hand)
+                strategy_key = (
+                    self.game.current_hand_index,
+                    current_hand.total,
+                    current_hand.is_soft,
+                    current_hand.num_cards,
+                    current_hand.can_split,
+                    dealer_up.rank
+                )
+                if strategy_key != self._last_strategy_key:
+                    self.strategy_display.update_strategy(current_hand, dealer_up, self.game.dealer_hand)
+                    self._last_strategy_key = strategy_key
         else:
-            self.strategy_display.clear_strategy()
+            self._reset_strategy()
         
         # Update betting panel
-        self.betting_panel.update_bankroll(self.game.player_bankroll)
+        self.betting_panel.update_bankroll(self.game.player_bankroll_cents)
         
         # Update action panel
         self.action_panel.update_actions(self.game)
         
         # Update status bar
-        status_text = f"State: {self.game.state.value.title()}"
-        if self.game.current_bet > 0:
-            status_text += f" | Bet: ${self.game.current_bet:.2f}"
-        status_text += f" | Games: {self.game.games_played} | Win Rate: {self.game.get_win_rate():.1%}"
-        self.status_bar.config(text=status_text)
+        status_text = f"State: {_STATE_LABELS[self.game.state]}"
+        if self.game.current_bet_cents > 0:
+            status_text += " | Bet: $" + format_cents(self.game.current_bet_cents)
+        status_text += f" | Games: {self.game.games_played} | Win Rate: {format_percent(self.game.get_win_rate())}"
+        if status_text != self._last_status_text:
+            self.status_var.set(status_text)
+            self._last_status_text = status_text
+        
+        # Apply the batched display widget changes, then repaint everything in one pass
+        self.display_scheduler.flush()
+        self.root.update_idletasks()
+    
+    def _reset_strategy(self):
+        """Clear the strategy display and forget the inputs it was last computed for."""
+        if self._last_strategy_key is not None:
+            self.strategy_display.clear_strategy()
+            self._last_strategy_key = None
     
     def _show_auto_stand_message(self):
         """Show a brief message when automatically standing on 21."""
@@ -601,16 +800,12 @@ class BlackjackGUI:
     def _on_close(self):
         """Handle window close event."""
         if messagebox.askokcancel("Quit", "Are you sure you want to quit?"):
-            self.root.destroy()
+            self.close()
     
     def run(self):
         """Start the GUI application."""
         self.root.mainloop()
     
-    def __del__(self):
-        """Cleanup when the GUI is destroyed."""
-        try:
-            if hasattr(self, 'root') and self.root:
-                self.root.destroy()
-        except:
-            pass  # Ignore errors during cleanup 
\ No newline at end of file
+    def close(self):
+        """Destroy the main window and end the application."""
+        self.root.destroy()
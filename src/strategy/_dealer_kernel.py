@@ -0,0 +1,93 @@
+"""
+Dealer draw enumeration on plain integers.
+
+Cards are grouped by blackjack value (2-10, with Aces stored under 11), which keeps
+the inner loops free of Rank lookups and merges the four ten-value ranks into one.
+"""
+
+from typing import List, Sequence
+
+# Values a drawn card can take; Aces are stored under 11
+CARD_VALUES = (2, 3, 4, 5, 6, 7, 8, 9, 10, 11)
+
+# Index used for a busted dealer hand in the result list
+BUST = 22
+
+
+def dealer_final_probs(total: int, soft: bool, counts: Sequence[int]) -> List[float]:
+    """
+    Enumerate the dealer's draws from a starting hand without replacement.
+
+    The dealer stands on all 17s. Pending hands are expanded one card at a time and
+    keyed by how many cards of each value they have drawn, packed into one integer,
+    so hands holding the same cards in a different order are merged.
+
+    Args:
+        total: The dealer's current total
+        soft: Whether that total counts an Ace as 11
+        counts: Remaining cards indexed by card value (index 11 holds the Aces)
+
+    Returns:
+        List indexed by final total, with probabilities at 17-21 and BUST
+    """
+    final = [0.0] * (BUST + 1)
+    if total >= 17:
+        final[total] = 1.0
+        return final
+
+    counts = [max(count, 0) for count in counts]
+    cards_left = sum(counts[value] for value in CARD_VALUES)
+
+    # Mixed-radix place value of each card value in the drawn-cards key
+    weights = [0] * len(counts)
+    weight = 1
+    for value in CARD_VALUES:
+        weights[value] = weight
+        weight *= counts[value] + 1
+
+    # Drawn-cards key -> [probability, total, soft]
+    hands = {0: [1.0, total, soft]}
+    while hands and cards_left > 0:
+        next_hands = {}
+        for drawn, (hand_prob, total, soft) in hands.items():
+            scale = hand_prob / cards_left
+            for value in CARD_VALUES:
+                count = counts[value]
+                if count:
+                    count -= drawn // weights[value] % (count + 1)
+                if not count:
+                    continue
+
+                # Ace counts as 11 if it doesn't bust, else as 1
+                if value == 11:
+                    if total + 11 <= 21:
+                        new_total = total + 11
+                        new_soft = True
+                    else:
+                        new_total = total + 1
+                        new_soft = soft
+                else:
+                    new_total = total + value
+                    new_soft = soft
+
+                # A soft hand that would bust counts its Ace as 1 instead
+                if new_total > 21 and new_soft:
+                    new_total -= 10
+                    new_soft = False
+
+                prob = scale * count
+                if new_total > 21:
+                    final[BUST] += prob
+                elif new_total >= 17:
+                    final[new_total] += prob
+                else:
+                    key = drawn + weights[value]
+                    pending = next_hands.get(key)
+                    if pending is None:
+                        next_hands[key] = [prob, new_total, new_soft]
+                    else:
+                        pending[0] += prob
+        hands = next_hands
+        cards_left -= 1
+
+    return final
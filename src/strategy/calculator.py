@@ -1,11 +1,10 @@
-import copy
-from typing import Dict, List, Tuple, Optional, Union, Literal
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
 from enum import Enum
-from collections import defaultdict
 from ..game.card import Card, Rank
 from ..game.hand import Hand
 from ..counting.counter import CardCounter
-from ..game.deck import Deck
+from ._dealer_kernel import BUST, dealer_final_probs
 
 
 class Action(Enum):
@@ -17,6 +16,155 @@ class Action(Enum):
     SURRENDER = "surrender"
 
 
+RANK_LIST = tuple(Rank)
+RANK_VALUES = tuple(rank.card_value for rank in RANK_LIST)
+RANK_IS_ACE = tuple(rank == Rank.ACE for rank in RANK_LIST)
+
+# (rank, probability, card value) for every rank that can still be drawn
+RankProbs = Tuple[Tuple[Rank, float, int], ...]
+
+
+# Basic strategy tables, indexed by dealer up card value (Ace = 11)
+_DEALER_UP_VALUES = range(2, 12)
+
+# Dealer up cards each pair should be split against
+_PAIR_SPLITS = {
+    # Always split Aces and 8s
+    Rank.ACE: _DEALER_UP_VALUES,
+    Rank.EIGHT: _DEALER_UP_VALUES,
+    # Split 10s (10, J, Q, K) vs dealer 5-6
+    Rank.TEN: (5, 6),
+    Rank.JACK: (5, 6),
+    Rank.QUEEN: (5, 6),
+    Rank.KING: (5, 6),
+    # Split 9s vs dealer 2-6, 8-9
+    Rank.NINE: (2, 3, 4, 5, 6, 8, 9),
+    # Split 7s vs dealer 2-7
+    Rank.SEVEN: (2, 3, 4, 5, 6, 7),
+    # Split 6s vs dealer 2-6
+    Rank.SIX: (2, 3, 4, 5, 6),
+    # Split 5s vs dealer 2-9
+    Rank.FIVE: (2, 3, 4, 5, 6, 7, 8, 9),
+    # Split 4s vs dealer 5-6
+    Rank.FOUR: (5, 6),
+    # Split 3s and 2s vs dealer 2-7
+    Rank.THREE: (2, 3, 4, 5, 6, 7),
+    Rank.TWO: (2, 3, 4, 5, 6, 7),
+}
+
+
+def _soft_action(player_total: int, dealer_up_value: int) -> Action:
+    """Basic strategy for a soft hand (containing Ace counted as 11)."""
+    if player_total >= 19:
+        return Action.STAND
+    elif player_total == 18:
+        if dealer_up_value in [9, 10, 11]:  # 11 = Ace
+            return Action.HIT
+        else:
+            return Action.STAND
+    else:
+        return Action.HIT
+
+
+def _hard_action(player_total: int, dealer_up_value: int) -> Action:
+    """Basic strategy for a hard hand."""
+    if player_total >= 17:
+        return Action.STAND
+    elif player_total == 16:
+        if dealer_up_value in [7, 8, 9, 10, 11]:
+            return Action.HIT
+        else:
+            return Action.STAND
+    elif player_total == 15:
+        if dealer_up_value in [10, 11]:
+            return Action.HIT
+        else:
+            return Action.STAND
+    elif player_total == 13 or player_total == 14:
+        if dealer_up_value in [2, 3, 4, 5, 6]:
+            return Action.STAND
+        else:
+            return Action.HIT
+    elif player_total == 12:
+        if dealer_up_value in [4, 5, 6]:
+            return Action.STAND
+        else:
+            return Action.HIT
+    else:
+        return Action.HIT
+
+
+# PAIR_TABLE[pair_rank][dealer_up_value] is SPLIT or None to fall through
+PAIR_TABLE = {
+    rank: tuple(Action.SPLIT if value in _PAIR_SPLITS[rank] else None for value in range(12))
+    for rank in RANK_LIST
+}
+
+# SOFT_TABLE / HARD_TABLE[player_total][dealer_up_value]
+SOFT_TABLE = tuple(tuple(_soft_action(total, value) for value in range(12)) for total in range(22))
+HARD_TABLE = tuple(tuple(_hard_action(total, value) for value in range(12)) for total in range(22))
+
+
+@lru_cache(maxsize=4096)
+def _basic_strategy(player_total: int, is_soft: bool, can_split: bool,
+                    split_rank: Optional[Rank], dealer_up_value: int) -> Action:
+    """Look up the basic strategy action for a hand's total, softness and pair rank."""
+    # This is a simplified basic strategy - in practice, this would be more comprehensive
+    
+    # Check for splits first (pairs)
+    if can_split:
+        action = PAIR_TABLE[split_rank][dealer_up_value]
+        if action is not None:
+            return action
+    
+    # Soft hands (containing Ace counted as 11)
+    if is_soft:
+        return SOFT_TABLE[player_total][dealer_up_value]
+    
+    # Hard hands (anything over 21 is looked up as 21)
+    return HARD_TABLE[min(player_total, 21)][dealer_up_value]
+
+
+class _BustState:
+    """Remaining card counts (in RANK_LIST order) for the bust probability calculation."""
+    
+    __slots__ = ("counts", "remaining")
+    
+    def __init__(self, counts: List[int], remaining: int):
+        self.counts = counts
+        self.remaining = remaining
+
+
+def _count_by_value(rank_counts: Sequence[int]) -> List[int]:
+    """Collapse card counts in RANK_LIST order into counts indexed by card value."""
+    value_counts = [0] * (BUST + 1)
+    for idx, count in enumerate(rank_counts):
+        value_counts[RANK_VALUES[idx]] += count
+    return value_counts
+
+
+def _apply_card(total: int, soft: bool, value: int) -> Tuple[int, bool]:
+    """
+    Add a card value (Ace as 11) to a player total, optimizing Aces like Hand.total.
+    
+    Returns:
+        Tuple of (new_total, new_soft)
+    """
+    if value == 11:
+        total += 1
+        if not soft and total + 10 <= 21:
+            total += 10
+            soft = True
+    else:
+        total += value
+    
+    if total > 21 and soft:
+        total -= 10
+        soft = False
+    
+    return total, soft
+
+
 class StrategyCalculator:
     """Calculates optimal strategy based on current count and deck composition."""
     
@@ -28,8 +176,39 @@ class StrategyCalculator:
             card_counter: The card counter tracking the current deck state
         """
         self.card_counter = card_counter
+        
+        # Caches tied to the deck composition they were computed from
+        self._deck_key = None
+        self._value_counts: List[int] = []
+        self._rank_prob_cache = ()
+        self._dealer_cache: Dict[Rank, Dict[int, float]] = {}
+        self._dealer_bust_cache: Dict[int, float] = {}
+        self._stand_ev_cache: Dict[Rank, List[float]] = {}
+    
+    def _sync_deck_caches(self) -> None:
+        """Drop cached results if cards have been dealt or the shoe reshuffled since they were built."""
+        key = tuple(map(self.card_counter._card_counts.__getitem__, RANK_LIST))
+        if key == self._deck_key:
+            return
+        
+        rank_probs = []
+        for idx, rank in enumerate(RANK_LIST):
+            prob = self.card_counter.get_probability(rank)
+            if prob > 0:
+                rank_probs.append((rank, prob, RANK_VALUES[idx]))
+        self._rank_prob_cache = tuple(rank_probs)
+        self._dealer_cache.clear()
+        self._dealer_bust_cache.clear()
+        self._stand_ev_cache.clear()
+        self._value_counts = _count_by_value(key)
+        self._deck_key = key
+    
+    def _get_rank_probs(self) -> RankProbs:
+        """Get (rank, probability, card value) for every rank still in the shoe."""
+        self._sync_deck_caches()
+        return self._rank_prob_cache
     
-    def get_optimal_action(self, player_hand: Hand, dealer_up_card: Card) -> Tuple[Action, float, Dict[str, float]]:
+    def get_optimal_action(self, player_hand: Hand, dealer_up_card: Card) -> Tuple[Action, float, Dict[str, float], Dict[Action, float]]:
         """
         Get the optimal action for the current situation.
         
@@ -38,81 +217,108 @@ class StrategyCalculator:
             dealer_up_card: The dealer's up card
             
         Returns:
-            Tuple of (optimal_action, expected_value, action_probabilities)
+            Tuple of (optimal_action, expected_value, action_probabilities, action_evs),
+            where action_evs maps every allowed action to its expected value
         """
         if player_hand.is_bust:
-            return Action.STAND, -1.0, {}
+            return Action.STAND, -1.0, {}, {Action.STAND: -1.0}
         
         if player_hand.is_blackjack:
-            return Action.STAND, 1.5, {}
+            return Action.STAND, 1.5, {}, {Action.STAND: 1.5}
+        
+        # The deck doesn't change while one decision is evaluated, so its draw
+        # probabilities and stand EVs are looked up once and shared by every action
+        rank_probs = self._get_rank_probs()
+        stand_evs = self._get_stand_evs(dealer_up_card)
         
         # Calculate expected values for all possible actions
         action_evs = {}
-        action_probs = {}
+        draw_methods = {Action.HIT: self._calculate_hit_ev}
         
         # Hit EV
-        hit_ev, hit_probs = self._calculate_hit_ev(player_hand, dealer_up_card)
-        action_evs[Action.HIT] = hit_ev
-        action_probs[Action.HIT] = hit_probs
+        action_evs[Action.HIT], _ = self._calculate_hit_ev(player_hand, dealer_up_card, rank_probs, stand_evs)
         
         # Stand EV
-        stand_ev, stand_probs = self._calculate_stand_ev(player_hand, dealer_up_card)
-        action_evs[Action.STAND] = stand_ev
-        action_probs[Action.STAND] = stand_probs
+        action_evs[Action.STAND] = stand_evs[player_hand.total]
         
         # Double EV (only if allowed)
         if player_hand.can_double:
-            double_ev, double_probs = self._calculate_double_ev(player_hand, dealer_up_card)
-            action_evs[Action.DOUBLE] = double_ev
-            action_probs[Action.DOUBLE] = double_probs
+            draw_methods[Action.DOUBLE] = self._calculate_double_ev
+            action_evs[Action.DOUBLE], _ = self._calculate_double_ev(player_hand, dealer_up_card, rank_probs, stand_evs)
         
         # Split EV (only if allowed)
         if player_hand.can_split:
-            split_ev, split_probs = self._calculate_split_ev(player_hand, dealer_up_card)
-            action_evs[Action.SPLIT] = split_ev
-            action_probs[Action.SPLIT] = split_probs
+            draw_methods[Action.SPLIT] = self._calculate_split_ev
+            action_evs[Action.SPLIT], _ = self._calculate_split_ev(player_hand, dealer_up_card, rank_probs, stand_evs)
         
         # Surrender EV (only if allowed and first two cards)
         if player_hand.num_cards == 2:
             surrender_ev = -0.5  # Always -50% of bet
             action_evs[Action.SURRENDER] = surrender_ev
-            action_probs[Action.SURRENDER] = {"surrender": 1.0}
         
-        # Find the best action
-        best_action = max(action_evs.keys(), key=lambda action: action_evs[action])
-        best_ev = action_evs[best_action]
+        # Find the best action (the first one wins a tie)
+        best_action, best_ev = None, -float('inf')
+        for action, ev in action_evs.items():
+            if ev > best_ev:
+                best_action, best_ev = action, ev
+        
+        # Only the best action's outcome breakdown is returned, so only it is collected
+        if best_action == Action.SURRENDER:
+            best_probs = {"surrender": 1.0}
+        elif best_action == Action.STAND:
+            _, best_probs = self._calculate_stand_ev(player_hand, dealer_up_card, _collect_probs=True)
+        else:
+            _, best_probs = draw_methods[best_action](player_hand, dealer_up_card, rank_probs, stand_evs,
+                                                      _collect_probs=True)
         
-        return best_action, best_ev, action_probs[best_action]
+        return best_action, best_ev, best_probs, action_evs
     
-    def _calculate_hit_ev(self, player_hand: Hand, dealer_up_card: Card) -> Tuple[float, Dict[str, float]]:
+    def _calculate_hit_ev(self, player_hand: Hand, dealer_up_card: Card,
+                          rank_probs: Optional[RankProbs] = None,
+                          stand_evs: Optional[List[float]] = None,
+                          _collect_probs: bool = False) -> Tuple[float, Dict[str, float]]:
         """Calculate expected value of hitting."""
+        if rank_probs is None:
+            rank_probs = self._get_rank_probs()
+        if stand_evs is None:
+            stand_evs = self._get_stand_evs(dealer_up_card)
+        
         total_ev = 0.0
         probabilities = {}
+        base_total = player_hand.total
+        base_soft = player_hand.is_soft
         
         # Calculate probability of each possible card
-        for rank in Rank:
-            prob = self.card_counter.get_probability(rank)
-            if prob > 0:
-                # Create a new hand with this card
-                new_hand = Hand(player_hand.cards.copy())
-                new_hand.add_card(Card(dealer_up_card.suit, rank))  # Suit doesn't matter for EV
-                
-                if new_hand.is_bust:
-                    # Bust - lose the bet
-                    ev = -1.0
+        for rank, prob, value in rank_probs:
+            # Add this card to the hand's total
+            new_total, _ = _apply_card(base_total, base_soft, value)
+            
+            if new_total > 21:
+                # Bust - lose the bet
+                ev = -1.0
+                if _collect_probs:
                     probabilities[f"bust_{rank.display}"] = prob
-                else:
-                    # Continue playing - recursive call
-                    ev, _ = self._calculate_stand_ev(new_hand, dealer_up_card)
+            else:
+                # Stand on the new total
+                ev = stand_evs[new_total]
+                if _collect_probs:
                     probabilities[f"hit_{rank.display}"] = prob
-                
-                total_ev += prob * ev
+            
+            total_ev += prob * ev
         
         return total_ev, probabilities
     
-    def _calculate_stand_ev(self, player_hand: Hand, dealer_up_card: Card) -> Tuple[float, Dict[str, float]]:
+    def _calculate_stand_ev(self, player_hand: Hand, dealer_up_card: Card,
+                            _collect_probs: bool = False) -> Tuple[float, Dict[str, float]]:
         """Calculate expected value of standing."""
-        player_total = player_hand.total
+        return self._calculate_stand_ev_for_total(player_hand.total, dealer_up_card, _collect_probs)
+    
+    def _calculate_stand_ev_for_total(self, player_total: int, dealer_up_card: Card,
+                                      _collect_probs: bool = False) -> Tuple[float, Dict[str, float]]:
+        """Calculate expected value of standing on a player total."""
+        if not _collect_probs and player_total <= 21:
+            return self._get_stand_evs(dealer_up_card)[player_total], {}
+        
         probabilities = {}
         
         # Calculate dealer's final hand distribution
@@ -124,53 +330,99 @@ class StrategyCalculator:
             if dealer_total > 21:
                 # Dealer busts - player wins
                 ev = 1.0
-                probabilities[f"dealer_bust_{dealer_total}"] = prob
+                if _collect_probs:
+                    probabilities[f"dealer_bust_{dealer_total}"] = prob
             elif player_total > dealer_total:
                 # Player wins
                 ev = 1.0
-                probabilities[f"player_win_{dealer_total}"] = prob
+                if _collect_probs:
+                    probabilities[f"player_win_{dealer_total}"] = prob
             elif player_total < dealer_total:
                 # Dealer wins
                 ev = -1.0
-                probabilities[f"dealer_win_{dealer_total}"] = prob
+                if _collect_probs:
+                    probabilities[f"dealer_win_{dealer_total}"] = prob
             else:
                 # Push
                 ev = 0.0
-                probabilities[f"push_{dealer_total}"] = prob
+                if _collect_probs:
+                    probabilities[f"push_{dealer_total}"] = prob
             
             total_ev += prob * ev
         
         return total_ev, probabilities
     
-    def _calculate_double_ev(self, player_hand: Hand, dealer_up_card: Card) -> Tuple[float, Dict[str, float]]:
+    def _get_stand_evs(self, dealer_up_card: Card) -> List[float]:
+        """
+        Get the EV of standing on every player total from 0 to 21 against an upcard.
+        
+        The list is built once per upcard rank and deck state, so the EV loops
+        turn each resulting total into an index instead of a dealer comparison.
+        """
+        self._sync_deck_caches()
+        stand_evs = self._stand_ev_cache.get(dealer_up_card.rank)
+        if stand_evs is not None:
+            return stand_evs
+        
+        dealer_probs = self._calculate_dealer_final_hand_probs(dealer_up_card)
+        stand_evs = []
+        for player_total in range(22):
+            total_ev = 0.0
+            for dealer_total, prob in dealer_probs.items():
+                if dealer_total > 21 or player_total > dealer_total:
+                    total_ev += prob
+                elif player_total < dealer_total:
+                    total_ev -= prob
+            stand_evs.append(total_ev)
+        
+        self._stand_ev_cache[dealer_up_card.rank] = stand_evs
+        return stand_evs
+    
+    def _calculate_double_ev(self, player_hand: Hand, dealer_up_card: Card,
+                             rank_probs: Optional[RankProbs] = None,
+                             stand_evs: Optional[List[float]] = None,
+                             _collect_probs: bool = False) -> Tuple[float, Dict[str, float]]:
         """Calculate expected value of doubling down."""
+        if rank_probs is None:
+            rank_probs = self._get_rank_probs()
+        if stand_evs is None:
+            stand_evs = self._get_stand_evs(dealer_up_card)
+        
         # Double down means exactly one more card
         total_ev = 0.0
         probabilities = {}
+        base_total = player_hand.total
+        base_soft = player_hand.is_soft
         
-        for rank in Rank:
-            prob = self.card_counter.get_probability(rank)
-            if prob > 0:
-                # Create a new hand with this card
-                new_hand = Hand(player_hand.cards.copy())
-                new_hand.add_card(Card(dealer_up_card.suit, rank))
-                
-                if new_hand.is_bust:
-                    # Bust - lose double the bet
-                    ev = -2.0
+        for rank, prob, value in rank_probs:
+            # Add this card to the hand's total
+            new_total, _ = _apply_card(base_total, base_soft, value)
+            
+            if new_total > 21:
+                # Bust - lose double the bet
+                ev = -2.0
+                if _collect_probs:
                     probabilities[f"double_bust_{rank.display}"] = prob
-                else:
-                    # Stand with the doubled hand
-                    ev, _ = self._calculate_stand_ev(new_hand, dealer_up_card)
-                    ev *= 2  # Double the bet
+            else:
+                # Stand with the doubled hand
+                ev = stand_evs[new_total] * 2  # Double the bet
+                if _collect_probs:
                     probabilities[f"double_{rank.display}"] = prob
-                
-                total_ev += prob * ev
+            
+            total_ev += prob * ev
         
         return total_ev, probabilities
     
-    def _calculate_split_ev(self, player_hand: Hand, dealer_up_card: Card) -> Tuple[float, Dict[str, float]]:
+    def _calculate_split_ev(self, player_hand: Hand, dealer_up_card: Card,
+                            rank_probs: Optional[RankProbs] = None,
+                            stand_evs: Optional[List[float]] = None,
+                            _collect_probs: bool = False) -> Tuple[float, Dict[str, float]]:
         """Calculate expected value of splitting."""
+        if rank_probs is None:
+            rank_probs = self._get_rank_probs()
+        if stand_evs is None:
+            stand_evs = self._get_stand_evs(dealer_up_card)
+        
         # For simplicity, we'll calculate the EV of one split hand and multiply by 2
         # This is an approximation - the actual EV is more complex due to card removal effects
         
@@ -180,21 +432,20 @@ class StrategyCalculator:
         probabilities = {}
         
         # Calculate EV for one split hand
-        for rank in Rank:
-            prob = self.card_counter.get_probability(rank)
-            if prob > 0:
-                # Create a new hand with split card + new card
-                new_hand = Hand([split_card])
-                new_hand.add_card(Card(dealer_up_card.suit, rank))
-                
-                if new_hand.is_bust:
-                    ev = -1.0
+        for rank, prob, value in rank_probs:
+            # Total of the split card + new card
+            new_total, _ = _apply_card(split_card.value, split_card.is_ace, value)
+            
+            if new_total > 21:
+                ev = -1.0
+                if _collect_probs:
                     probabilities[f"split_bust_{rank.display}"] = prob
-                else:
-                    ev, _ = self._calculate_stand_ev(new_hand, dealer_up_card)
+            else:
+                ev = stand_evs[new_total]
+                if _collect_probs:
                     probabilities[f"split_{rank.display}"] = prob
-                
-                total_ev += prob * ev
+            
+            total_ev += prob * ev
         
         # Multiply by 2 for the second split hand (approximation)
         total_ev *= 2
@@ -204,79 +455,27 @@ class StrategyCalculator:
     def _calculate_dealer_final_hand_probs(self, dealer_up_card: Card) -> Dict[int, float]:
         """
         Accurately simulate the dealer's final hand probabilities given an upcard
-        using recursive enumeration.
+        by enumerating the dealer's draws against the remaining deck.
+        
+        Results are cached per upcard rank until the deck composition changes.
         """
-        from collections import defaultdict
-
-        memo = {}
+        self._sync_deck_caches()
+        cached = self._dealer_cache.get(dealer_up_card.rank)
+        if cached is not None:
+            return cached
 
-        def recurse(total, soft, deck_counts):
-            key = (total, soft, tuple(deck_counts.values()))
-            if key in memo:
-                return memo[key].copy()
-            
-            probs = defaultdict(float)
-            
-            # Dealer stands on 17+ (including soft 17)
-            if total >= 17:
-                probs[total] = 1.0
-                memo[key] = probs.copy()
-                return probs
-            
-            # Otherwise, dealer must hit
-            total_cards = sum(deck_counts.values())
-            for rank in Rank:
-                count = deck_counts[rank]
-                if count == 0:
-                    continue
-                prob = count / total_cards
-                
-                # Prepare the new deck state
-                new_deck_counts = deck_counts.copy()
-                new_deck_counts[rank] -= 1
-                
-                # Determine card value
-                card_value = rank.card_value
-                # Handle Ace as 11 if it doesn't bust, else as 1
-                if rank == Rank.ACE:
-                    if total + 11 <= 21:
-                        new_total = total + 11
-                        new_soft = True
-                    else:
-                        new_total = total + 1
-                        new_soft = soft
-                else:
-                    new_total = total + card_value
-                    new_soft = soft
-
-                # If soft 17+ is reached and hand is soft, treat as stand (S17 rules)
-                if new_total > 21 and new_soft:
-                    new_total -= 10
-                    new_soft = False
-                if new_total > 21:
-                    probs[22] += prob  # bust
-                else:
-                    subprobs = recurse(new_total, new_soft, new_deck_counts)
-                    for t, p in subprobs.items():
-                        probs[t] += prob * p
-
-            memo[key] = probs.copy()
-            return probs
-
-        # Build the deck count (simulate one card missing for upcard)
-        from collections import Counter
-        deck_counts = Counter()
-        for rank in Rank:
-            deck_counts[rank] = self.card_counter.get_card_count(rank)
-        # Remove the upcard
-        deck_counts[dealer_up_card.rank] -= 1
+        # Build the deck count by card value (simulate one card missing for upcard)
+        value_counts = self._value_counts.copy()
+        value_counts[dealer_up_card.value] -= 1
 
         # Start dealer total/soft
         total = dealer_up_card.value
         soft = (dealer_up_card.rank == Rank.ACE)
 
-        final_probs = recurse(total, soft, deck_counts)
-        return dict(final_probs)
+        outcomes = dealer_final_probs(total, soft, value_counts)
+        final_probs = {dealer_total: prob for dealer_total, prob in enumerate(outcomes) if prob}
+        self._dealer_cache[dealer_up_card.rank] = final_probs
+        return final_probs
     
     def _calculate_dealer_bust_probability(self, dealer_up_card: Card) -> float:
         """Calculate the probability that the dealer will bust."""
@@ -288,13 +487,13 @@ class StrategyCalculator:
         # Calculate probability of going over 21
         bust_prob = 0.0
         
-        for rank in Rank:
+        for idx, rank in enumerate(RANK_LIST):
             prob = self.card_counter.get_probability(rank)
             if prob > 0:
-                new_total = dealer_total + rank.card_value
+                new_total = dealer_total + RANK_VALUES[idx]
                 
                 # Adjust for Aces
-                if rank == Rank.ACE and new_total > 21:
+                if RANK_IS_ACE[idx] and new_total > 21:
                     new_total = dealer_total + 1  # Use Ace as 1
                 
                 if new_total > 21:
@@ -325,96 +524,9 @@ class StrategyCalculator:
     
     def get_basic_strategy_action(self, player_hand: Hand, dealer_up_card: Card) -> Action:
         """Get the basic strategy action (for comparison)."""
-        # This is a simplified basic strategy - in practice, this would be more comprehensive
-        
-        player_total = player_hand.total
-        dealer_up_value = dealer_up_card.value
-        
-        # Check for splits first (pairs)
-        if player_hand.can_split:
-            split_rank = player_hand.cards[0].rank
-            
-            # Always split Aces and 8s
-            if split_rank == Rank.ACE or split_rank == Rank.EIGHT:
-                return Action.SPLIT
-            
-            # Split 10s (10, J, Q, K) vs dealer 5-6
-            if split_rank in [Rank.TEN, Rank.JACK, Rank.QUEEN, Rank.KING]:
-                if dealer_up_value in [5, 6]:
-                    return Action.SPLIT
-            
-            # Split 9s vs dealer 2-6, 8-9
-            if split_rank == Rank.NINE:
-                if dealer_up_value in [2, 3, 4, 5, 6, 8, 9]:
-                    return Action.SPLIT
-            
-            # Split 7s vs dealer 2-7
-            if split_rank == Rank.SEVEN:
-                if dealer_up_value in [2, 3, 4, 5, 6, 7]:
-                    return Action.SPLIT
-            
-            # Split 6s vs dealer 2-6
-            if split_rank == Rank.SIX:
-                if dealer_up_value in [2, 3, 4, 5, 6]:
-                    return Action.SPLIT
-            
-            # Split 5s vs dealer 2-9
-            if split_rank == Rank.FIVE:
-                if dealer_up_value in [2, 3, 4, 5, 6, 7, 8, 9]:
-                    return Action.SPLIT
-            
-            # Split 4s vs dealer 5-6
-            if split_rank == Rank.FOUR:
-                if dealer_up_value in [5, 6]:
-                    return Action.SPLIT
-            
-            # Split 3s vs dealer 2-7
-            if split_rank == Rank.THREE:
-                if dealer_up_value in [2, 3, 4, 5, 6, 7]:
-                    return Action.SPLIT
-            
-            # Split 2s vs dealer 2-7
-            if split_rank == Rank.TWO:
-                if dealer_up_value in [2, 3, 4, 5, 6, 7]:
-                    return Action.SPLIT
-        
-        # Soft hands (containing Ace counted as 11)
-        if player_hand.is_soft:
-            if player_total >= 19:
-                return Action.STAND
-            elif player_total == 18:
-                if dealer_up_value in [9, 10, 11]:  # 11 = Ace
-                    return Action.HIT
-                else:
-                    return Action.STAND
-            else:
-                return Action.HIT
-        
-        # Hard hands
-        if player_total >= 17:
-            return Action.STAND
-        elif player_total == 16:
-            if dealer_up_value in [7, 8, 9, 10, 11]:
-                return Action.HIT
-            else:
-                return Action.STAND
-        elif player_total == 15:
-            if dealer_up_value in [10, 11]:
-                return Action.HIT
-            else:
-                return Action.STAND
-        elif player_total == 13 or player_total == 14:
-            if dealer_up_value in [2, 3, 4, 5, 6]:
-                return Action.STAND
-            else:
-                return Action.HIT
-        elif player_total == 12:
-            if dealer_up_value in [4, 5, 6]:
-                return Action.STAND
-            else:
-                return Action.HIT
-        else:
-            return Action.HIT
+        can_split = player_hand.can_split
+        split_rank = player_hand.cards[0].rank if can_split else None
+        return _basic_strategy(player_hand.total, player_hand.is_soft, can_split, split_rank, dealer_up_card.value)
     
     def get_insurance_recommendation(self) -> Dict[str, any]:
         """Get insurance recommendation based on current count."""
@@ -446,22 +558,12 @@ class StrategyCalculator:
     
     def get_strategy_comparison(self, player_hand: Hand, dealer_up_card: Card) -> Dict[str, any]:
         """Get a comparison between basic strategy and count-based strategy."""
-        optimal_action, optimal_ev, optimal_probs = self.get_optimal_action(player_hand, dealer_up_card)
+        optimal_action, optimal_ev, optimal_probs, action_evs = self.get_optimal_action(player_hand, dealer_up_card)
 
         basic_action = self.get_basic_strategy_action(player_hand, dealer_up_card)
         
-        # Calculate EV for basic strategy action
-        basic_ev = 0.0
-        if basic_action == Action.HIT:
-            basic_ev, _ = self._calculate_hit_ev(player_hand, dealer_up_card)
-        elif basic_action == Action.STAND:
-            basic_ev, _ = self._calculate_stand_ev(player_hand, dealer_up_card)
-        elif basic_action == Action.DOUBLE and player_hand.can_double:
-            basic_ev, _ = self._calculate_double_ev(player_hand, dealer_up_card)
-        elif basic_action == Action.SPLIT and player_hand.can_split:
-            basic_ev, _ = self._calculate_split_ev(player_hand, dealer_up_card)
-        elif basic_action == Action.SURRENDER and player_hand.num_cards == 2:
-            basic_ev = -0.5
+        # The basic strategy action's EV was already computed alongside the optimal one
+        basic_ev = action_evs.get(basic_action, 0.0)
         
         return {
             "optimal_action": optimal_action,
@@ -484,33 +586,37 @@ class StrategyCalculator:
         Returns:
             Probability of busting (0.0 to 1.0)
         """
-        # Create a mock deck with current card counts for bust probability calculation
-        class MockDeck:
-            def __init__(self, card_counts, total_cards):
-                self._card_counts = card_counts.copy()
-                self.cards_remaining = total_cards
+        is_dealer = role != 'player'
+        self._sync_deck_caches()
+        if is_dealer:
+            cached = self._dealer_bust_cache.get(hand_total)
+            if cached is not None:
+                return cached
         
         total_cards = self.card_counter._initial_deck_size - self.card_counter._total_cards_seen
-        mock_deck = MockDeck(self.card_counter._card_counts, total_cards)
+        deck = _BustState(list(self._deck_key), total_cards)
         
-        return self._calculate_bust_probability(hand_total, mock_deck, role)
+        bust_prob = self._calculate_bust_probability(hand_total, deck, is_dealer)
+        if is_dealer:
+            self._dealer_bust_cache[hand_total] = bust_prob
+        return bust_prob
 
     def _calculate_bust_probability(
         self,
         hand_total: int, 
-        deck: Deck, 
-        role: Union[Literal['dealer'], Literal['player']]
+        deck: "_BustState", 
+        is_dealer: bool
     ) -> float:
         """
         Calculate the bust probability for a given hand total and deck state.
         
         For players: calculates probability of busting on the next draw only
-        For dealers: calculates probability of busting following dealer rules (recursive)
+        For dealers: calculates probability of busting following dealer rules
         
         Args:
             hand_total: Current hand total
-            deck: Current deck state
-            role: 'dealer' or 'player' to determine calculation method
+            deck: Remaining card counts
+            is_dealer: True to follow dealer rules, False for the player's next draw
             
         Returns:
             Probability of busting (0.0 to 1.0)
@@ -518,19 +624,21 @@ class StrategyCalculator:
         if hand_total > 21:
             return 1.0
         
+        counts = deck.counts
+        
         # For players: calculate bust probability on next draw only
-        if role == 'player':
+        if not is_dealer:
             bust_prob = 0.0
-            total_deck_count = deck.cards_remaining
+            total_deck_count = deck.remaining
             
-            for rank in list(deck._card_counts.keys()):
-                if deck._card_counts[rank] == 0:
+            for idx, count in enumerate(counts):
+                if count == 0:
                     continue
                     
-                card_prob = deck._card_counts[rank] / total_deck_count
+                card_prob = count / total_deck_count
                 
                 # Handle Ace specially - it can be 1 or 11
-                if rank == Rank.ACE:
+                if RANK_IS_ACE[idx]:
                     # Use Ace optimally (as 1 if 11 would bust)
                     if hand_total + 11 > 21:
                         # Ace as 1 - check if it busts
@@ -542,42 +650,13 @@ class StrategyCalculator:
                             bust_prob += card_prob
                 else:
                     # Regular card - check if it busts
-                    if hand_total + rank.card_value > 21:
+                    if hand_total + RANK_VALUES[idx] > 21:
                         bust_prob += card_prob
             
             return bust_prob
         
-        # For dealers: recursive calculation following dealer rules
+        # For dealers: draw to 17 following dealer rules, with the hand starting hard
         if hand_total >= 17:
             return 0.0  # Dealer stands
 
-        total_prob = 0.0
-        total_deck_count = deck.cards_remaining
-
-        for rank in list(deck._card_counts.keys()):
-            if deck._card_counts[rank] == 0:
-                continue
-                
-            # Copy deck and remove 1 card
-            new_deck = copy.deepcopy(deck)
-            new_deck._card_counts[rank] -= 1
-            
-            card_prob = deck._card_counts[rank] / total_deck_count
-            
-            # Handle Ace specially - it can be 1 or 11
-            if rank == Rank.ACE:
-                # Try Ace as 11 first, then as 1 if it would bust
-                if hand_total + 11 > 21:
-                    # Must use Ace as 1
-                    new_total = hand_total + 1
-                    total_prob += card_prob * self._calculate_bust_probability(new_total, new_deck, role)
-                else:
-                    # Can use Ace as 11, so use it optimally (as 11 unless it causes immediate bust)
-                    new_total = hand_total + 11
-                    total_prob += card_prob * self._calculate_bust_probability(new_total, new_deck, role)
-            else:
-                # Regular card
-                new_total = hand_total + rank.card_value
-                total_prob += card_prob * self._calculate_bust_probability(new_total, new_deck, role)
-
-        return total_prob 
\ No newline at end of file
+        return dealer_final_probs(hand_total, False, _count_by_value(counts))[BUST]
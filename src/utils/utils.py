@@ -2,21 +2,20 @@
 Utility functions for the GUI.
 """
 
-import tkinter as tk
+from functools import lru_cache
 
-def draw_rounded_rect(canvas, x1, y1, x2, y2, r, **kwargs):
-    points = [
-            x1+r, y1,
-            x2-r, y1,
-            x2, y1,
-            x2, y1+r,
-            x2, y2-r,
-            x2, y2,
-            x2-r, y2,
-            x1+r, y2,
-            x1, y2,
-            x1, y2-r,
-            x1, y1+r,
-            x1, y1
-    ]
-    return canvas.create_polygon(points, smooth=True, **kwargs)
\ No newline at end of file
+@lru_cache(maxsize=1024)
+def format_money(value: float) -> str:
+    """Format a dollar amount with two decimals (bets repeat, so results are cached)."""
+    return f"{value:.2f}"
+
+def format_cents(cents: int) -> str:
+    """Format an integer number of cents as dollars with thousands separators and two decimals."""
+    sign = "-" if cents < 0 else ""
+    dollars, cents = divmod(abs(cents), 100)
+    return f"{sign}{dollars:,}.{cents:02d}"
+
+@lru_cache(maxsize=1024)
+def format_percent(value: float) -> str:
+    """Format a ratio as a percentage with one decimal (results are cached)."""
+    return f"{value:.1%}"